@@ -3,6 +3,7 @@
 from .core import AnalysisResult, SessionAnalyzer
 from .intent_analyzer import IntentAnalysisResult, IntentAnalyzer
 from .reranker import RerankingWeights, ResultReranker
+from .session_index import SessionIndex
 from .smart_search import (
     LocalSessionSearcher,
     SearchResult,
@@ -22,6 +23,7 @@ __all__ = [
     # Local search
     "LocalSessionSearcher",
     "SearchResult",
+    "SessionIndex",
     # Reranking
     "ResultReranker",
     "RerankingWeights",
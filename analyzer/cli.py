@@ -3,17 +3,136 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import re
 import sys
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, Any
 
 from .core import AnalysisResult, SessionAnalyzer
 from .smart_search import quick_search
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+__all__ = ["cmd_analyze", "cmd_search", "format_result", "main", "parse_date"]
+
+# Relative date keywords and how far back from today they reach
+_RELATIVE_DATES = {
+    "today": timedelta(days=0),
+    "yesterday": timedelta(days=1),
+    "week": timedelta(days=7),
+    "7days": timedelta(days=7),
+    "month": timedelta(days=30),
+    "30days": timedelta(days=30),
+}
+
+# Exact shape handed to date.fromisoformat, which alone would accept more
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+# Markup tags emitted by this module, removed when printing without Rich
+_MARKUP_RE = re.compile(r"\[/?(?:bold )?(?:bold|dim|red|green|yellow|blue|cyan)\]")
+
+# Display color for each session outcome (anything else is yellow)
+_OUTCOME_COLORS = {"success": "green", "failure": "red"}
+
+
+class _PlainConsole:
+    """Minimal stand-in for a Rich console when stdout is not a terminal."""
+
+    def print(self, *objects: Any) -> None:
+        """Print objects with markup tags stripped."""
+        print(*(_MARKUP_RE.sub("", str(obj)) for obj in objects))
+
+
+def _make_console(format_type: str) -> Console | _PlainConsole:
+    """Create a console for command output.
+
+    Rich is only imported when its rendering is visible (a terminal) or
+    required (tables), keeping piped and JSON invocations fast to start.
+
+    Args:
+        format_type: Requested output format
+
+    Returns:
+        A Rich console, or a plain console for non-terminal output
+    """
+    if format_type == "table" or sys.stdout.isatty():
+        from rich.console import Console
+
+        return Console()
+    return _PlainConsole()
+
+
+def _json_default(obj: Any) -> str:
+    """Serialize values the stdlib encoder doesn't handle."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        data: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return data
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default).encode()
+
+
+def _dump_json(obj: Any) -> str:
+    """Serialize to indented JSON text."""
+    return _encode_json(obj).decode()
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write raw bytes to stdout, falling back to text streams without a buffer."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(data)
+    else:
+        sys.stdout.write(data.decode())
+
+
+def _stream_json_array(items: Iterable[Any]) -> None:
+    """Write items to stdout as an indented JSON array, one element at a time.
+
+    The output is identical to dumping the whole list at once, but no
+    list of records or full serialized string is ever held in memory.
+    """
+    sys.stdout.flush()
+    first = True
+    for item in items:
+        # Nest each element one level deeper (JSON strings never contain raw newlines)
+        chunk = b"  " + _encode_json(item).replace(b"\n", b"\n  ")
+        _write_stdout((b"[\n" if first else b",\n") + chunk)
+        first = False
+    _write_stdout(b"[]\n" if first else b"\n]\n")
+    sys.stdout.flush()
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_absolute_date(date_str: str) -> datetime | None:
+    """Parse a YYYY-MM-DD date string to midnight of that day."""
+    if _ISO_DATE_RE.fullmatch(date_str):
+        try:
+            # C fast path for zero-padded dates; it also takes forms like 20260216
+            return datetime.combine(date.fromisoformat(date_str), time())
+        except ValueError:
+            pass
+    try:
+        # Also accept non-padded dates such as 2026-2-1
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        return None
+
 
 def format_result(result: AnalysisResult, format_type: str = "text") -> str:
     """Format analysis result for output.
@@ -26,16 +145,14 @@ def format_result(result: AnalysisResult, format_type: str = "text") -> str:
         Formatted string
     """
     if format_type == "json":
-        return json.dumps(
+        return _dump_json(
             {
                 "goals": result.goals,
                 "actions": result.actions,
                 "outcome": result.outcome,
                 "confidence": result.confidence,
                 "summary": result.summary,
-            },
-            ensure_ascii=False,
-            indent=2,
+            }
         )
 
     if format_type == "markdown":
@@ -91,27 +208,18 @@ def parse_date(date_str: str, end_of_day: bool = False) -> datetime | None:
     Returns:
         datetime object or None if parsing fails
     """
-    from datetime import timedelta
-
     date_str = date_str.lower().strip()
 
     # Handle relative dates
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-
-    if date_str == "today":
-        base = today
-    elif date_str == "yesterday":
-        base = today - timedelta(days=1)
-    elif date_str == "week" or date_str == "7days":
-        base = today - timedelta(days=7)
-    elif date_str == "month" or date_str == "30days":
-        base = today - timedelta(days=30)
+    offset = _RELATIVE_DATES.get(date_str)
+    if offset is not None:
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        base = today - offset
     else:
-        # Handle YYYY-MM-DD format
-        try:
-            base = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
+        parsed = _parse_absolute_date(date_str)
+        if parsed is None:
             return None
+        base = parsed
 
     if end_of_day:
         return base.replace(hour=23, minute=59, second=59)
@@ -120,7 +228,7 @@ def parse_date(date_str: str, end_of_day: bool = False) -> datetime | None:
 
 def cmd_search(args: argparse.Namespace) -> int:
     """Handle search command."""
-    console = Console()
+    console = _make_console(args.format)
 
     query = " ".join(args.query) if args.query else ""
 
@@ -164,22 +272,22 @@ def cmd_search(args: argparse.Namespace) -> int:
             time_desc = f" ({', '.join(parts)})"
 
         if args.format == "json":
-            output = []
-            for r in results:
-                output.append(
-                    {
-                        "session_id": r.session_id,
-                        "project_path": r.project_path,
-                        "summary": r.summary,
-                        "goals": r.goals,
-                        "actions": r.actions,
-                        "outcome": r.outcome,
-                        "similarity": r.similarity,
-                        "timestamp": r.timestamp.isoformat() if r.timestamp else None,
-                    }
-                )
-            print(json.dumps(output, ensure_ascii=False, indent=2))
+            _stream_json_array(
+                {
+                    "session_id": r.session_id,
+                    "project_path": r.project_path,
+                    "summary": r.summary,
+                    "goals": r.goals,
+                    "actions": r.actions,
+                    "outcome": r.outcome,
+                    "similarity": r.similarity,
+                    "timestamp": r.timestamp,
+                }
+                for r in results
+            )
         elif args.format == "table":
+            from rich.table import Table
+
             title = f"Search Results: {query}" if query else "Sessions"
             table = Table(title=title + time_desc)
             table.add_column("#", style="dim", width=3)
@@ -209,43 +317,26 @@ def cmd_search(args: argparse.Namespace) -> int:
                     f"\n[bold green]Found {len(results)} sessions{time_desc}:[/bold green]\n"
                 )
             for i, r in enumerate(results, 1):
-                # Format timestamp
-                time_str = ""
-                if r.timestamp:
-                    time_str = r.timestamp.strftime("%Y-%m-%d %H:%M")
+                time_str = r.timestamp.strftime("%Y-%m-%d %H:%M") if r.timestamp else ""
 
                 # Session ID (truncate for display)
                 session_id = r.session_id
                 session_id_short = session_id[:16] + "..." if len(session_id) > 16 else session_id
 
-                console.print(
+                # Render each result with a single print call
+                lines = [
                     f"[bold]{i}[/bold]. [cyan][{session_id_short}][/cyan] {time_str}  [dim]{r.project_path}[/dim]"
-                )
-
-                # Goals
+                ]
                 if r.goals:
-                    goals_str = ", ".join(r.goals[:3])
-                    console.print(f"   [green]Goals:[/green] {goals_str}")
-
-                # Actions
+                    lines.append(f"   [green]Goals:[/green] {', '.join(r.goals[:3])}")
                 if r.actions:
-                    actions_str = ", ".join(r.actions[:3])
-                    console.print(f"   [blue]Actions:[/blue] {actions_str}")
-
-                # Outcome
+                    lines.append(f"   [blue]Actions:[/blue] {', '.join(r.actions[:3])}")
                 if r.outcome:
-                    outcome_color = (
-                        "green"
-                        if r.outcome == "success"
-                        else "red"
-                        if r.outcome == "failure"
-                        else "yellow"
-                    )
-                    console.print(f"   [{outcome_color}]Outcome:[/{outcome_color}] {r.outcome}")
-
-                # Resume command
-                console.print(f"   [dim]Resume: claude --resume {session_id}[/dim]")
-                console.print()
+                    color = _OUTCOME_COLORS.get(r.outcome, "yellow")
+                    lines.append(f"   [{color}]Outcome:[/{color}] {r.outcome}")
+                lines.append(f"   [dim]Resume: claude --resume {session_id}[/dim]")
+                lines.append("")
+                console.print("\n".join(lines))
 
         return 0
     except Exception as e:
@@ -255,38 +346,43 @@ def cmd_search(args: argparse.Namespace) -> int:
 
 def cmd_analyze(args: argparse.Namespace) -> int:
     """Handle analyze command."""
-    console = Console()
+    console = _make_console(args.format)
     analyzer = SessionAnalyzer()
 
     paths = [Path(p) for p in args.sessions]
-    results = []
-
     for path in paths:
-        try:
-            result = analyzer.analyze(path)
-            results.append((path.name, result))
-        except FileNotFoundError:
+        if not path.exists():
             console.print(f"[red]Error: File not found: {path}[/red]")
             return 1
-        except Exception as e:
-            console.print(f"[red]Error analyzing {path}: {e}[/red]")
-            return 1
+
+    try:
+        analyses = analyzer.analyze_batch(paths)
+    except Exception:
+        # Batch errors don't say which file failed; retry one by one to name it
+        analyses = []
+        for path in paths:
+            try:
+                analyses.append(analyzer.analyze(path))
+            except Exception as e:
+                console.print(f"[red]Error analyzing {path}: {e}[/red]")
+                return 1
+    results = [(path.name, result) for path, result in zip(paths, analyses, strict=True)]
 
     if args.format == "json":
-        output = []
-        for name, result in results:
-            output.append(
-                {
-                    "file": name,
-                    "goals": result.goals,
-                    "actions": result.actions,
-                    "outcome": result.outcome,
-                    "confidence": result.confidence,
-                    "summary": result.summary,
-                }
-            )
-        print(json.dumps(output, ensure_ascii=False, indent=2))
+        _stream_json_array(
+            {
+                "file": name,
+                "goals": result.goals,
+                "actions": result.actions,
+                "outcome": result.outcome,
+                "confidence": result.confidence,
+                "summary": result.summary,
+            }
+            for name, result in results
+        )
     elif args.format == "table":
+        from rich.table import Table
+
         table = Table(title="Session Analysis Results")
         table.add_column("File", style="cyan")
         table.add_column("Goals", style="green")
@@ -310,8 +406,8 @@ def cmd_analyze(args: argparse.Namespace) -> int:
     return 0
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Main entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the fully configured argument parser."""
     parser = argparse.ArgumentParser(
         prog="csa",
         description="Analyze Claude Code session transcripts",
@@ -378,10 +474,23 @@ def main(argv: list[str] | None = None) -> int:
     )
     search_parser.set_defaults(func=cmd_search)
 
-    args = parser.parse_args(argv)
+    return parser
+
+
+# Built on first use and reused by later main() calls in the same process
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+
+    args = _PARSER.parse_args(argv)
 
     if args.command is None:
-        parser.print_help()
+        _PARSER.print_help()
         return 0
 
     result = args.func(args)
@@ -2,12 +2,35 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import itertools
 import json
+import logging
+import os
+import pickle
 import re
+import tempfile
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, cast
 
-import jieba
+try:
+    import jieba_fast as jieba  # C-accelerated drop-in replacement
+except ImportError:  # pragma: no cover - optional speedup
+    import jieba
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+logger = logging.getLogger(__name__)
+
+# Fastest available JSON decoder; both raise ValueError subclasses on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 @dataclass
@@ -23,162 +46,304 @@ class AnalysisResult:
 
 
 # Goal indicator keywords (what the user wants to achieve)
-GOAL_KEYWORDS = {
-    "实现",
-    "添加",
-    "创建",
-    "修复",
-    "优化",
-    "重构",
-    "部署",
-    "编写",
-    "完成",
-    "解决",
-    "处理",
-    "改进",
-    "设计",
-    "开发",
-    "implement",
-    "add",
-    "create",
-    "fix",
-    "optimize",
-    "refactor",
-    "deploy",
-    "write",
-    "complete",
-    "solve",
-    "improve",
-    "design",
-}
+GOAL_KEYWORDS = frozenset(
+    {
+        "实现",
+        "添加",
+        "创建",
+        "修复",
+        "优化",
+        "重构",
+        "部署",
+        "编写",
+        "完成",
+        "解决",
+        "处理",
+        "改进",
+        "设计",
+        "开发",
+        "implement",
+        "add",
+        "create",
+        "fix",
+        "optimize",
+        "refactor",
+        "deploy",
+        "write",
+        "complete",
+        "solve",
+        "improve",
+        "design",
+    }
+)
 
 # Action indicator keywords (what was actually done)
-ACTION_KEYWORDS = {
-    "修改",
-    "删除",
-    "更新",
-    "新建",
-    "编辑",
-    "运行",
-    "测试",
-    "提交",
-    "合并",
-    "安装",
-    "配置",
-    "添加",
-    "移除",
-    "调整",
-    "modify",
-    "delete",
-    "update",
-    "create",
-    "edit",
-    "run",
-    "test",
-    "commit",
-    "merge",
-    "install",
-    "configure",
-    "add",
-    "remove",
-}
+ACTION_KEYWORDS = frozenset(
+    {
+        "修改",
+        "删除",
+        "更新",
+        "新建",
+        "编辑",
+        "运行",
+        "测试",
+        "提交",
+        "合并",
+        "安装",
+        "配置",
+        "添加",
+        "移除",
+        "调整",
+        "modify",
+        "delete",
+        "update",
+        "create",
+        "edit",
+        "run",
+        "test",
+        "commit",
+        "merge",
+        "install",
+        "configure",
+        "add",
+        "remove",
+    }
+)
 
 # Success indicator keywords
-SUCCESS_KEYWORDS = {
-    "成功",
-    "完成",
-    "通过",
-    "正常",
-    "已解决",
-    "已实现",
-    "✅",
-    "succeeded",
-    "completed",
-    "passed",
-    "done",
-    "resolved",
-    "✓",
-}
+SUCCESS_KEYWORDS = frozenset(
+    {
+        "成功",
+        "完成",
+        "通过",
+        "正常",
+        "已解决",
+        "已实现",
+        "✅",
+        "succeeded",
+        "completed",
+        "passed",
+        "done",
+        "resolved",
+        "✓",
+    }
+)
 
 # Failure indicator keywords
-FAILURE_KEYWORDS = {
-    "失败",
-    "错误",
-    "异常",
-    "问题",
-    "报错",
-    "崩溃",
-    "❌",
-    "failed",
-    "error",
-    "exception",
-    "issue",
-    "crash",
-    "✗",
-}
+FAILURE_KEYWORDS = frozenset(
+    {
+        "失败",
+        "错误",
+        "异常",
+        "问题",
+        "报错",
+        "崩溃",
+        "❌",
+        "failed",
+        "error",
+        "exception",
+        "issue",
+        "crash",
+        "✗",
+    }
+)
 
 # Partial success indicators
-PARTIAL_KEYWORDS = {
-    "部分",
-    "待处理",
-    "进行中",
-    "未完成",
-    "需要",
-    "partial",
-    "pending",
-    "in progress",
-    "todo",
-    "remaining",
-}
+PARTIAL_KEYWORDS = frozenset(
+    {
+        "部分",
+        "待处理",
+        "进行中",
+        "未完成",
+        "需要",
+        "partial",
+        "pending",
+        "in progress",
+        "todo",
+        "remaining",
+    }
+)
+
+# Lowercased outcome keywords, matched against lowercased session text
+_SUCCESS_KEYWORDS_LOWER = tuple(kw.lower() for kw in SUCCESS_KEYWORDS)
+_FAILURE_KEYWORDS_LOWER = tuple(kw.lower() for kw in FAILURE_KEYWORDS)
+_PARTIAL_KEYWORDS_LOWER = tuple(kw.lower() for kw in PARTIAL_KEYWORDS)
+
+# File extensions recognized as edited files
+FILE_EXTENSIONS = ("ts", "tsx", "js", "jsx", "py", "md", "json", "yaml", "yml")
 
 # File patterns to extract (matches full filenames including dots in name)
-# Use non-capturing group to get full match from findall
-FILE_PATTERN = re.compile(r"\b[a-zA-Z_][\w./]*\.(?:ts|tsx|js|jsx|py|md|json|yaml|yml)\b")
+FILE_PATTERN = re.compile(rf"\b[a-zA-Z_][\w./]*\.(?:{'|'.join(FILE_EXTENSIONS)})\b")
+
+# Sentence boundaries used to split session text
+SENTENCE_SPLIT_PATTERN = re.compile(r"[。.!?\n]")
+
+# Request prefixes stripped from goal phrases
+GOAL_PREFIX_PATTERN = re.compile(r"^(请|帮我|我想要|需要|Let me|I want to)\s*")
+
+# ASCII word runs grouped the way jieba groups them (decimals and a trailing % stay attached)
+ASCII_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+(?:\.\d+)?%?")
+
+# Maximum number of goals and actions reported per session
+MAX_GOALS = 3
+MAX_ACTIONS = 5
 
 # Confidence thresholds
 HIGH_CONFIDENCE = 0.8
 MEDIUM_CONFIDENCE = 0.5
 
+# Default location for the opt-in analysis cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "claude-session-analyzer"
+
+# Bump whenever analysis output changes so stale cache entries are ignored
+CACHE_VERSION = 1
+
+# Below either threshold a batch is analyzed serially: worker start-up
+# (including a jieba dictionary load under spawn/forkserver) costs more than
+# the ~2 MB/s of analysis it would parallelize
+PARALLEL_MIN_FILES = 4
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+
+# Technical terms added to the jieba dictionary
+TECHNICAL_TERMS = (
+    "TypeScript",
+    "JavaScript",
+    "React",
+    "Vue",
+    "Python",
+    "API",
+    "REST",
+    "GraphQL",
+    "JWT",
+    "OAuth",
+    "测试",
+    "单元测试",
+    "集成测试",
+    "E2E",
+    "部署",
+    "CI/CD",
+    "Docker",
+    "Kubernetes",
+    "数据库",
+    "PostgreSQL",
+    "MySQL",
+    "MongoDB",
+)
+
+
+def _get_tokenizer(user_dict_path: str | None = None) -> jieba.Tokenizer:
+    """Return the initialized jieba tokenizer for a dictionary, built once per process.
+
+    Each custom dictionary gets its own tokenizer, so analyzers with
+    different dictionaries never see each other's words and the global
+    jieba instance is left untouched.
+    """
+    # Normalize so (), (None,) and ("",) share one cache entry
+    return _build_tokenizer(user_dict_path or None)
+
+
+@functools.cache
+def _build_tokenizer(user_dict_path: str | None) -> jieba.Tokenizer:
+    """Build an initialized jieba tokenizer; cached by ``_get_tokenizer``."""
+    tokenizer = jieba.Tokenizer()
+    tokenizer.initialize()
+    if user_dict_path:
+        tokenizer.load_userdict(user_dict_path)
+    for term in TECHNICAL_TERMS:
+        tokenizer.add_word(term)
+    return tokenizer
+
+
+# Per-process analyzer used by ``analyze_batch`` worker processes
+_worker_analyzer: SessionAnalyzer | None = None
+
+
+def _init_worker(
+    user_dict_path: str | None, cache_dir: Path | None, extract_keywords: bool
+) -> None:
+    """Create and warm one analyzer per worker process."""
+    global _worker_analyzer
+    _worker_analyzer = SessionAnalyzer(
+        user_dict_path, cache_dir=cache_dir, extract_keywords=extract_keywords
+    )
+    _worker_analyzer.preload()
+
+
+def _worth_parallelizing(paths: Sequence[str | Path]) -> bool:
+    """Whether a batch is large enough for worker processes to pay off."""
+    if len(paths) < PARALLEL_MIN_FILES:
+        return False
+    total = 0
+    for p in paths:
+        try:
+            total += os.stat(p).st_size
+        except OSError:
+            continue
+        if total >= PARALLEL_MIN_BYTES:
+            return True
+    return False
+
+
+def _analyze_in_worker(path: str | Path) -> AnalysisResult:
+    """Analyze a single session file inside a worker process."""
+    analyzer = _worker_analyzer or SessionAnalyzer()
+    return analyzer.analyze(path)
+
+
+def _tokenize(text: str, tokenizer: jieba.Tokenizer | None = None) -> list[str]:
+    """Segment text into words, bypassing jieba for pure-ASCII text.
+
+    Dictionary segmentation only matters for CJK text, so ASCII text is
+    split on alphanumeric runs directly, which is far cheaper.
+
+    Args:
+        text: Text to segment
+        tokenizer: jieba tokenizer to use. Defaults to the shared tokenizer
+            without a custom dictionary.
+    """
+    if text.isascii():
+        return ASCII_TOKEN_PATTERN.findall(text)
+    # jieba is untyped, so its lcut() result is Any
+    return cast(list[str], (tokenizer or _get_tokenizer()).lcut(text))
+
 
 class SessionAnalyzer:
     """Analyzes Claude Code session transcripts using NLP."""
 
-    def __init__(self, user_dict_path: str | None = None):
+    def __init__(
+        self,
+        user_dict_path: str | None = None,
+        cache_dir: str | Path | None = None,
+        extract_keywords: bool = False,
+    ):
         """Initialize analyzer with optional custom dictionary.
 
+        Dictionaries are loaded lazily on first use, see ``preload``.
+
         Args:
             user_dict_path: Path to custom jieba dictionary
+            cache_dir: Directory for caching results across runs, keyed by
+                session path, mtime and size (e.g. ``DEFAULT_CACHE_DIR``).
+                Caching is disabled when None.
+            extract_keywords: Fill ``AnalysisResult.raw_keywords`` by segmenting
+                the whole transcript. Off by default since nothing else in the
+                analysis uses them.
+        """
+        self.user_dict_path = user_dict_path
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir is not None else None
+        self.extract_keywords = extract_keywords
+
+    @property
+    def _tokenizer(self) -> jieba.Tokenizer:
+        """jieba tokenizer for this analyzer's dictionary."""
+        return _get_tokenizer(self.user_dict_path)
+
+    def preload(self) -> None:
+        """Load jieba dictionaries so the first analysis doesn't pay for it.
+
+        Safe to call repeatedly; dictionaries are loaded once per process.
         """
-        if user_dict_path:
-            jieba.load_userdict(user_dict_path)
-
-        # Add technical terms to jieba dictionary
-        technical_terms = [
-            "TypeScript",
-            "JavaScript",
-            "React",
-            "Vue",
-            "Python",
-            "API",
-            "REST",
-            "GraphQL",
-            "JWT",
-            "OAuth",
-            "测试",
-            "单元测试",
-            "集成测试",
-            "E2E",
-            "部署",
-            "CI/CD",
-            "Docker",
-            "Kubernetes",
-            "数据库",
-            "PostgreSQL",
-            "MySQL",
-            "MongoDB",
-        ]
-        for term in technical_terms:
-            jieba.add_word(term)
+        _get_tokenizer(self.user_dict_path)
 
     def analyze(self, session_path: str | Path) -> AnalysisResult:
         """Analyze a session transcript file.
@@ -193,15 +358,32 @@ class SessionAnalyzer:
         if not path.exists():
             raise FileNotFoundError(f"Session file not found: {path}")
 
-        # Read and parse session content
-        content = self._read_session(path)
-        text = self._extract_text(content)
+        if self.cache_dir is None:
+            return self._analyze_uncached(path)
+
+        # Stat before reading so a concurrent write invalidates the entry
+        st = path.stat()
+        cache_file = self.cache_dir / self._cache_key(path)
+        cached = self._load_cached(cache_file, st)
+        if cached is not None:
+            return cached
+
+        result = self._analyze_uncached(path)
+        self._store_cached(cache_file, st, result)
+        return result
+
+    def _analyze_uncached(self, path: Path) -> AnalysisResult:
+        """Run the full analysis pipeline on a session file."""
+        self.preload()
+
+        # Stream text straight out of the parsed lines
+        text = " ".join(self._iter_session_texts(path))
 
         # Extract components
         result = AnalysisResult()
-        result.raw_keywords = self._extract_keywords(text)
-        result.goals = self._extract_goals(text, result.raw_keywords)
-        result.actions = self._extract_actions(text, result.raw_keywords)
+        if self.extract_keywords:
+            result.raw_keywords = self._extract_keywords(text)
+        result.goals, result.actions = self._extract_goals_and_actions(text)
         result.outcome = self._determine_outcome(text)
         result.confidence = self._calculate_confidence(result)
 
@@ -211,73 +393,193 @@ class SessionAnalyzer:
 
         return result
 
+    def clear_cache(self) -> None:
+        """Delete all cached analysis results."""
+        if self.cache_dir is None:
+            return
+        for cache_file in self.cache_dir.glob("*.pkl"):
+            try:
+                cache_file.unlink()
+            except OSError as e:
+                logger.debug(f"Could not remove cache entry {cache_file}: {e}")
+
+    def discard_cached(self, paths: Iterable[str | Path]) -> None:
+        """Delete cached results for the given sessions, e.g. after they are removed.
+
+        Args:
+            paths: Session file paths whose cache entries should be dropped
+        """
+        if self.cache_dir is None:
+            return
+        for path in paths:
+            cache_file = self.cache_dir / self._cache_key(Path(path))
+            try:
+                cache_file.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Could not remove cache entry {cache_file}: {e}")
+
+    def _lookup_cached(self, path: Path) -> AnalysisResult | None:
+        """Return the cached result for a session if it is still current."""
+        if self.cache_dir is None:
+            return None
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return self._load_cached(self.cache_dir / self._cache_key(path), st)
+
+    def _cache_key(self, path: Path) -> str:
+        """Return the cache file name for a session path."""
+        key = f"{path.resolve()}\0{self.user_dict_path or ''}\0{self.extract_keywords}".encode()
+        return f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.pkl"
+
+    def _load_cached(self, cache_file: Path, st: os.stat_result) -> AnalysisResult | None:
+        """Load a cached result if it matches the session's current mtime and size."""
+        try:
+            with open(cache_file, "rb") as f:
+                version, mtime_ns, size, result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {cache_file}: {e}")
+            return None
+
+        if (version, mtime_ns, size) != (CACHE_VERSION, st.st_mtime_ns, st.st_size):
+            return None
+        cached: AnalysisResult = result
+        return cached
+
+    def _store_cached(self, cache_file: Path, st: os.stat_result, result: AnalysisResult) -> None:
+        """Atomically write a result to the cache."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    payload = (CACHE_VERSION, st.st_mtime_ns, st.st_size, result)
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, cache_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write cache entry {cache_file}: {e}")
+
+    def _iter_entries(self, path: Path) -> Iterator[Any]:
+        """Yield parsed entries from a JSONL session file, skipping invalid lines."""
+        # One binary read; both decoders accept UTF-8 bytes directly
+        with open(path, "rb") as f:
+            data = f.read()
+
+        for line in data.split(b"\n"):
+            line = line.strip()
+            if line:
+                try:
+                    yield _json_loads(line)
+                except ValueError:  # invalid JSON or invalid UTF-8
+                    continue
+
+    @staticmethod
+    def _iter_entry_texts(entry: dict) -> Iterator[str]:
+        """Yield text fragments from a single session entry."""
+        # Handle different message formats
+        if "text" in entry:
+            yield entry["text"]
+        elif "content" in entry:
+            if isinstance(entry["content"], str):
+                yield entry["content"]
+            elif isinstance(entry["content"], list):
+                for item in entry["content"]:
+                    if isinstance(item, dict) and "text" in item:
+                        yield item["text"]
+        elif "message" in entry:
+            msg = entry["message"]
+            if isinstance(msg, str):
+                yield msg
+            elif isinstance(msg, dict) and "content" in msg:
+                yield str(msg["content"])
+
+    def _iter_session_texts(self, path: Path) -> Iterator[str]:
+        """Stream text fragments from a session file without keeping its entries."""
+        iter_entry_texts = self._iter_entry_texts
+        for entry in self._iter_entries(path):
+            yield from iter_entry_texts(entry)
+
     def _read_session(self, path: Path) -> list[dict]:
         """Read JSONL session file."""
-        content = []
-        with open(path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        content.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-        return content
+        return list(self._iter_entries(path))
 
     def _extract_text(self, content: list[dict]) -> str:
         """Extract text content from session messages."""
-        texts = []
-        for entry in content:
-            # Handle different message formats
-            if "text" in entry:
-                texts.append(entry["text"])
-            elif "content" in entry:
-                if isinstance(entry["content"], str):
-                    texts.append(entry["content"])
-                elif isinstance(entry["content"], list):
-                    for item in entry["content"]:
-                        if isinstance(item, dict) and "text" in item:
-                            texts.append(item["text"])
-            elif "message" in entry:
-                msg = entry["message"]
-                if isinstance(msg, str):
-                    texts.append(msg)
-                elif isinstance(msg, dict) and "content" in msg:
-                    texts.append(str(msg["content"]))
-        return " ".join(texts)
+        iter_entry_texts = self._iter_entry_texts
+        return " ".join(text for entry in content for text in iter_entry_texts(entry))
 
     def _extract_keywords(self, text: str) -> list[str]:
         """Extract keywords using jieba segmentation."""
-        words = jieba.lcut(text)
+        words = _tokenize(text, self._tokenizer)
         # Filter out single characters and common stop words
         keywords = [w for w in words if len(w) > 1 and not w.isspace() and not w.isnumeric()]
         return keywords
 
     def _extract_goals(self, text: str, _keywords: list[str]) -> list[str]:
         """Extract session goals from text."""
-        goals = []
+        goals, _ = self._extract_goals_and_actions(text)
+        return goals
+
+    def _extract_goals_and_actions(self, text: str) -> tuple[list[str], list[str]]:
+        """Extract goals and actions in a single pass over the sentences.
 
-        # Find sentences with goal keywords
-        sentences = re.split(r"[。.!?\n]", text)
+        Each sentence is segmented once and checked against both the goal
+        and action keyword sets. Scanning stops as soon as both lists are full.
+
+        Returns:
+            Tuple of (top goals, top actions)
+        """
+        goals: list[str] = []
+        actions: list[str] = []
+        # Sets mirror the lists for constant-time duplicate checks
+        seen_goals: set[str] = set()
+        seen_actions: set[str] = set()
+
+        # Find file modifications, stopping after the first 5 matches
+        for match in itertools.islice(FILE_PATTERN.finditer(text), MAX_ACTIONS):
+            action = f"修改 {match.group(0)}"
+            if action not in seen_actions:
+                seen_actions.add(action)
+                actions.append(action)
+
+        # Find sentences with goal or action keywords
+        tokenizer = self._tokenizer
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
         for sentence in sentences:
+            goals_full = len(goals) >= MAX_GOALS
+            actions_full = len(actions) >= MAX_ACTIONS
+            if goals_full and actions_full:
+                break
+
             sentence = sentence.strip()
             if not sentence:
                 continue
 
-            # Check for goal keywords
-            words = set(jieba.lcut(sentence))
-            if words & GOAL_KEYWORDS:
+            words = _tokenize(sentence, tokenizer)
+            if not goals_full and not GOAL_KEYWORDS.isdisjoint(words):
                 # Extract the main goal phrase
                 goal = self._extract_goal_phrase(sentence)
-                if goal and goal not in goals:
+                if goal and goal not in seen_goals:
+                    seen_goals.add(goal)
                     goals.append(goal)
+            if not actions_full and not ACTION_KEYWORDS.isdisjoint(words):
+                action_phrase = self._extract_action_phrase(sentence)
+                if action_phrase and action_phrase not in seen_actions:
+                    seen_actions.add(action_phrase)
+                    actions.append(action_phrase)
 
-        return goals[:3]  # Limit to top 3 goals
+        return goals, actions
 
     def _extract_goal_phrase(self, sentence: str) -> str | None:
         """Extract the core goal phrase from a sentence."""
         # Remove common prefixes
-        sentence = re.sub(r"^(请|帮我|我想要|需要|Let me|I want to)\s*", "", sentence)
+        sentence = GOAL_PREFIX_PATTERN.sub("", sentence, count=1)
 
         # Limit length
         if len(sentence) > 50:
@@ -287,29 +589,8 @@ class SessionAnalyzer:
 
     def _extract_actions(self, text: str, _keywords: list[str]) -> list[str]:
         """Extract actions taken during session."""
-        actions = []
-
-        # Find file modifications (use findall to get full match, not just group)
-        file_matches = FILE_PATTERN.findall(text)
-        for f in file_matches[:5]:  # Limit to 5 files
-            action = f"修改 {f}"
-            if action not in actions:
-                actions.append(action)
-
-        # Find sentences with action keywords
-        sentences = re.split(r"[。.!?\n]", text)
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            words = set(jieba.lcut(sentence))
-            if words & ACTION_KEYWORDS:
-                action_phrase = self._extract_action_phrase(sentence)
-                if action_phrase and action_phrase not in actions:
-                    actions.append(action_phrase)
-
-        return actions[:5]  # Limit to top 5 actions
+        _, actions = self._extract_goals_and_actions(text)
+        return actions
 
     def _extract_action_phrase(self, sentence: str) -> str | None:
         """Extract the core action phrase from a sentence."""
@@ -323,9 +604,9 @@ class SessionAnalyzer:
         """Determine the outcome of the session."""
         text_lower = text.lower()
 
-        success_count = sum(1 for kw in SUCCESS_KEYWORDS if kw.lower() in text_lower)
-        failure_count = sum(1 for kw in FAILURE_KEYWORDS if kw.lower() in text_lower)
-        partial_count = sum(1 for kw in PARTIAL_KEYWORDS if kw.lower() in text_lower)
+        success_count = sum(1 for kw in _SUCCESS_KEYWORDS_LOWER if kw in text_lower)
+        failure_count = sum(1 for kw in _FAILURE_KEYWORDS_LOWER if kw in text_lower)
+        partial_count = sum(1 for kw in _PARTIAL_KEYWORDS_LOWER if kw in text_lower)
 
         total = success_count + failure_count + partial_count
         if total == 0:
@@ -390,6 +671,53 @@ class SessionAnalyzer:
 
         return " → ".join(parts) if parts else ""
 
-    def analyze_batch(self, paths: list[str | Path]) -> list[AnalysisResult]:
-        """Analyze multiple session files."""
-        return [self.analyze(p) for p in paths]
+    def analyze_batch(
+        self, paths: Sequence[str | Path], max_workers: int | None = None
+    ) -> list[AnalysisResult]:
+        """Analyze multiple session files.
+
+        Files are independent, so large batches (at least PARALLEL_MIN_FILES
+        files and PARALLEL_MIN_BYTES in total) are spread over worker
+        processes, each loading its own dictionaries. Smaller batches are
+        analyzed serially in this process.
+
+        Args:
+            paths: Session files to analyze
+            max_workers: Worker process limit. Defaults to the CPU count;
+                1 analyzes serially in this process.
+
+        Returns:
+            Analysis results in the same order as ``paths``
+        """
+        results: list[AnalysisResult | None] = [None] * len(paths)
+        pending = list(paths)
+
+        # Serve cache hits up front so only stale sessions reach the workers
+        if self.cache_dir is not None:
+            pending = []
+            for i, p in enumerate(paths):
+                cached = self._lookup_cached(Path(p))
+                if cached is None:
+                    pending.append(p)
+                else:
+                    results[i] = cached
+
+        fresh = iter(self._analyze_many(pending, max_workers) if pending else ())
+        return [r if r is not None else next(fresh) for r in results]
+
+    def _analyze_many(
+        self, paths: Sequence[str | Path], max_workers: int | None
+    ) -> list[AnalysisResult]:
+        """Analyze session files, spreading large batches over worker processes."""
+        workers = min(len(paths), max_workers or os.cpu_count() or 1)
+        if workers <= 1 or not _worth_parallelizing(paths):
+            analyze = self.analyze
+            return [analyze(p) for p in paths]
+
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.user_dict_path, self.cache_dir, self.extract_keywords),
+        ) as executor:
+            return list(executor.map(_analyze_in_worker, paths, chunksize=chunksize))
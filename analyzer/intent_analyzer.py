@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from dataclasses import dataclass, field
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 
 @dataclass
@@ -39,6 +43,19 @@ INTENT_ANALYSIS_PROMPT = """你是一个会话搜索助手。用户想找到之
 只返回 JSON，不要其他内容。"""
 
 
+# Number of distinct queries whose LLM analysis is kept in memory
+INTENT_CACHE_SIZE = 512
+
+# Maximum concurrent API requests made by analyze_batch
+BATCH_CONCURRENCY = 8
+
+# Filler words stripped by the fallback analysis; English words only match whole words
+FALLBACK_STRIP_PATTERN = re.compile(r"继续|做|搞|(?<![A-Za-z])(?:the|for|to)(?![A-Za-z])")
+
+# Phrases that mark a query as being about recent work
+RECENT_PATTERN = re.compile(r"最近|上次|刚才|recent|last|yesterday")
+
+
 class IntentAnalyzer:
     """Analyzes user search queries using LLM to extract search intent."""
 
@@ -56,40 +73,78 @@ class IntentAnalyzer:
             )
         self.model = model
         self.client = Anthropic(api_key=self.api_key)
+        # LRU of LLM analyses by query, most recently used last
+        self._cache: OrderedDict[str, IntentAnalysisResult] = OrderedDict()
 
     def analyze(self, query: str) -> IntentAnalysisResult:
         """Analyze user query and extract search intent.
 
+        Repeated queries are answered from an in-memory LRU cache instead of
+        calling the LLM again. Fallback results are never cached.
+
         Args:
             query: User's natural language search query
 
         Returns:
             IntentAnalysisResult with extracted concepts, time hint, and project hint
         """
-        prompt = INTENT_ANALYSIS_PROMPT.format(query=query)
+        cached = self._get_cached(query)
+        if cached is not None:
+            return cached
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=256,
-                messages=[{"role": "user", "content": prompt}],
-            )
-
-            # Extract text from response
-            text_content = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    text_content += block.text
-
-            # Parse JSON response
-            result = self._parse_response(text_content)
-            result.raw_response = text_content
-            return result
-
+            result = self._analyze_uncached(query)
         except Exception as e:
             # Fallback: use simple keyword extraction
             return self._fallback_analysis(query, str(e))
 
+        return self._store_cached(query, result)
+
+    def _get_cached(self, query: str) -> IntentAnalysisResult | None:
+        """Return a copy of the cached analysis for a query, if any."""
+        cached = self._cache.get(query)
+        if cached is None:
+            return None
+        self._cache.move_to_end(query)
+        return replace(cached, concepts=list(cached.concepts))
+
+    def _store_cached(self, query: str, result: IntentAnalysisResult) -> IntentAnalysisResult:
+        """Cache an analysis, evicting the least recently used, and return a copy."""
+        self._cache[query] = result
+        if len(self._cache) > INTENT_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return replace(result, concepts=list(result.concepts))
+
+    def _request_params(self, query: str) -> dict[str, Any]:
+        """Build the Messages API parameters for analyzing a query."""
+        return {
+            "model": self.model,
+            "max_tokens": 256,
+            "messages": [{"role": "user", "content": INTENT_ANALYSIS_PROMPT.format(query=query)}],
+        }
+
+    def _result_from_response(self, response: Any) -> IntentAnalysisResult:
+        """Parse a Messages API response into an IntentAnalysisResult."""
+        # Extract text from response
+        text_content = ""
+        for block in response.content:
+            if hasattr(block, "text"):
+                text_content += block.text
+
+        # Parse JSON response
+        result = self._parse_response(text_content)
+        result.raw_response = text_content
+        return result
+
+    def _analyze_uncached(self, query: str) -> IntentAnalysisResult:
+        """Ask the LLM to analyze a query.
+
+        Raises:
+            Exception: Any error from the API request
+        """
+        response = self.client.messages.create(**self._request_params(query))
+        return self._result_from_response(response)
+
     def _parse_response(self, response_text: str) -> IntentAnalysisResult:
         """Parse LLM JSON response into IntentAnalysisResult."""
         # Clean up response - remove markdown code blocks if present
@@ -118,9 +173,7 @@ class IntentAnalyzer:
         concepts: list[str] = []
 
         # Split by common delimiters and filter
-        text = query.replace("继续", " ").replace("做", " ").replace("搞", " ")
-        text = text.replace("the", " ").replace("for", " ").replace("to", " ")
-        words = text.split()
+        words = FALLBACK_STRIP_PATTERN.sub(" ", query).split()
 
         for word in words:
             if len(word) > 1 and word not in ["继续", "做", "想", "要"]:
@@ -129,10 +182,7 @@ class IntentAnalyzer:
                     break
 
         # Detect time hint
-        time_hint = "all_time"
-        recent_keywords = ["最近", "上次", "刚才", "recent", "last", "yesterday"]
-        if any(kw in query for kw in recent_keywords):
-            time_hint = "recent"
+        time_hint = "recent" if RECENT_PATTERN.search(query) else "all_time"
 
         return IntentAnalysisResult(
             concepts=concepts[:5],
@@ -142,5 +192,48 @@ class IntentAnalyzer:
         )
 
     def analyze_batch(self, queries: list[str]) -> list[IntentAnalysisResult]:
-        """Analyze multiple queries."""
-        return [self.analyze(q) for q in queries]
+        """Analyze multiple queries.
+
+        Queries missing from the cache are sent concurrently through the
+        async client, at most ``BATCH_CONCURRENCY`` at a time. Must not be
+        called from inside a running event loop.
+
+        Args:
+            queries: User queries to analyze
+
+        Returns:
+            Results in the same order as ``queries``
+        """
+        found: dict[str, IntentAnalysisResult] = {}
+        pending: list[str] = []
+        for query in dict.fromkeys(queries):
+            cached = self._get_cached(query)
+            if cached is None:
+                pending.append(query)
+            else:
+                found[query] = cached
+
+        if pending:
+            outcomes = asyncio.run(self._analyze_many_async(pending))
+            for query, outcome in zip(pending, outcomes, strict=True):
+                if isinstance(outcome, BaseException):
+                    found[query] = self._fallback_analysis(query, str(outcome))
+                else:
+                    found[query] = self._store_cached(query, outcome)
+
+        return [replace(found[q], concepts=list(found[q].concepts)) for q in queries]
+
+    async def _analyze_many_async(
+        self, queries: list[str]
+    ) -> list[IntentAnalysisResult | BaseException]:
+        """Request analyses concurrently, returning errors in place of results."""
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async with AsyncAnthropic(api_key=self.api_key) as client:
+
+            async def analyze_one(query: str) -> IntentAnalysisResult:
+                async with semaphore:
+                    response = await client.messages.create(**self._request_params(query))
+                return self._result_from_response(response)
+
+            return await asyncio.gather(*(analyze_one(q) for q in queries), return_exceptions=True)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -25,6 +27,11 @@ class RerankingWeights:
             raise ValueError(f"Weights must sum to 1.0, got {total}")
 
 
+def _split_words(text: str) -> tuple[str, ...]:
+    """Split a project name or path into words on whitespace, '-' and '_'."""
+    return tuple(text.replace("-", " ").replace("_", " ").split())
+
+
 class ResultReranker:
     """Reranks search results using multi-signal fusion."""
 
@@ -44,6 +51,29 @@ class ResultReranker:
         self.weights = weights or RerankingWeights()
         self.current_project = current_project
         self.half_life_days = half_life_days
+        # Lowercased form and words of each project path seen so far
+        self._project_tokens: dict[str, tuple[str, tuple[str, ...]]] = {}
+
+    @property
+    def current_project(self) -> str | None:
+        """Current project path for project matching bonus."""
+        return self._current_project
+
+    @current_project.setter
+    def current_project(self, value: str | None) -> None:
+        self._current_project = value
+        self._current_lower = value.lower() if value else None
+
+    @property
+    def half_life_days(self) -> float:
+        """Half-life for time decay in days."""
+        return self._half_life_days
+
+    @half_life_days.setter
+    def half_life_days(self, value: float) -> None:
+        self._half_life_days = value
+        # 0.5 ** (days / half_life) == exp(days * coeff), with a cheaper exp
+        self._decay_coeff = math.log(0.5) / value
 
     def rerank(
         self,
@@ -67,30 +97,45 @@ class ResultReranker:
         # Calculate time boost for recent queries
         time_boost = 1.5 if time_hint == "recent" else 1.0
 
-        # Calculate final score for each result
-        scored_results = []
+        # One clock reading for the whole batch, in both naive and aware forms
+        now = datetime.now()
+        now_utc = datetime.now(timezone.utc)
+
+        # Per-batch invariants, hoisted out of the scoring loop
+        w_similarity = self.weights.similarity
+        w_time = self.weights.time_decay
+        w_project = self.weights.project_match
+        hint_lower = project_hint.lower() if project_hint else None
+        hint_words = _split_words(hint_lower) if hint_lower else ()
+        normalize = self._normalize_similarity
+        time_decay = self._calculate_time_decay
+        project_score = self._project_score
+
+        # Store each final score in the similarity field
         for result in results:
-            score = self._calculate_score(result, project_hint, time_boost)
-            result.similarity = score  # Store final score in similarity field
-            scored_results.append(result)
+            ts = result.timestamp
+            result.similarity = (
+                normalize(result.similarity) * w_similarity
+                + time_decay(ts, time_boost, now_utc if ts and ts.tzinfo else now) * w_time
+                + project_score(result.project_path, hint_lower, hint_words) * w_project
+            )
 
         # Sort by score descending
-        scored_results.sort(key=lambda r: r.similarity, reverse=True)
-
-        return scored_results
+        return sorted(results, key=attrgetter("similarity"), reverse=True)
 
     def _calculate_score(
         self,
         result: SearchResult,
         project_hint: str | None,
         time_boost: float,
+        now: datetime | None = None,
     ) -> float:
         """Calculate final score for a result.
 
         final_score = similarity * 0.5 + time_decay * 0.2 + project_match * 0.3
         """
         similarity_score = self._normalize_similarity(result.similarity)
-        time_score = self._calculate_time_decay(result.timestamp, time_boost)
+        time_score = self._calculate_time_decay(result.timestamp, time_boost, now)
         project_score = self._calculate_project_match(result, project_hint)
 
         final_score = (
@@ -113,25 +158,29 @@ class ResultReranker:
         self,
         timestamp: datetime | None,
         boost: float = 1.0,
+        now: datetime | None = None,
     ) -> float:
         """Calculate time decay score.
 
-        Uses exponential decay: score = e^(-days / half_life) * boost
+        Uses exponential decay: score = 0.5^(days / half_life) * boost
+
+        Args:
+            timestamp: Session timestamp
+            boost: Multiplier applied to the decay
+            now: Reference time matching the timestamp's awareness. Defaults
+                to the current time.
         """
         if not timestamp:
             return 0.5  # Neutral score if no timestamp
 
-        now = datetime.now()
-        if timestamp.tzinfo:
-            from datetime import timezone
-
-            now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc) if timestamp.tzinfo else datetime.now()
 
         age = now - timestamp
         days: float = age.total_seconds() / 86400  # Convert to days
 
         # Exponential decay
-        decay: float = 0.5 ** (days / self.half_life_days)
+        decay = math.exp(days * self._decay_coeff)
 
         return float(min(decay * boost, 1.0))
 
@@ -145,9 +194,23 @@ class ResultReranker:
         Returns 1.0 if project matches current project or hint,
         0.5 otherwise (neutral).
         """
-        result_project = result.project_path.lower()
         hint_lower = project_hint.lower() if project_hint else None
-        current_lower = self.current_project.lower() if self.current_project else None
+        hint_words = _split_words(hint_lower) if hint_lower else ()
+        return self._project_score(result.project_path, hint_lower, hint_words)
+
+    def _project_score(
+        self,
+        project_path: str,
+        hint_lower: str | None,
+        hint_words: tuple[str, ...],
+    ) -> float:
+        """Score a project path against a lowercased, pre-split project hint."""
+        tokens = self._project_tokens.get(project_path)
+        if tokens is None:
+            lower = project_path.lower()
+            tokens = self._project_tokens[project_path] = (lower, _split_words(lower))
+        result_project, result_words = tokens
+        current_lower = self._current_lower
 
         # Check if result matches project hint
         if hint_lower and hint_lower in result_project:
@@ -158,11 +221,7 @@ class ResultReranker:
             return 0.9
 
         # Check partial match with hint
-        if hint_lower:
-            # Split into words and check partial matches
-            hint_words = hint_lower.replace("-", " ").replace("_", " ").split()
-            result_words = result_project.replace("-", " ").replace("_", " ").split()
-
+        if hint_words:
             matches = sum(1 for w in hint_words if any(w in rw for rw in result_words))
             if matches > 0:
                 return 0.7 + (0.1 * min(matches, 3))
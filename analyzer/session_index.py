@@ -0,0 +1,186 @@
+"""Persistent per-session search index."""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the pickled index layout changes
+INDEX_VERSION = 2
+
+
+class IndexEntry(NamedTuple):
+    """Indexed data for one session file."""
+
+    mtime_ns: int
+    size: int
+    words: frozenset[str]
+    summary: str
+
+
+class SessionIndex:
+    """Session word sets and summaries persisted between searches.
+
+    Entries are keyed by session path and validated against each file's
+    mtime and size, so only new or modified sessions need to be re-read.
+    An in-memory inverted index maps each word to the sessions containing it.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize an empty index backed by a pickle file.
+
+        Args:
+            path: File the index is loaded from and saved to
+        """
+        self.path = path
+        self.entries: dict[str, IndexEntry] = {}
+        self.postings: dict[str, set[str]] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        """Load entries from disk, starting empty if the file is missing or stale."""
+        try:
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable search index {self.path}: {e}")
+            return
+
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+            self.entries = data["entries"]
+            # Postings are derived from the entries rather than persisted
+            self.postings = {}
+            for key, entry in self.entries.items():
+                self._add_postings(key, entry.words)
+
+    def save(self) -> None:
+        """Atomically write the index to disk if it changed since loading."""
+        if not self._dirty:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    data = {"version": INDEX_VERSION, "entries": self.entries}
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write search index {self.path}: {e}")
+            return
+
+        self._dirty = False
+
+    def get(self, session_path: Path, st: os.stat_result) -> IndexEntry | None:
+        """Return the entry for a session if it is still current.
+
+        Args:
+            session_path: Path to session file
+            st: Current stat result for the session file
+
+        Returns:
+            The cached entry, or None if missing or the file has changed
+        """
+        entry = self.entries.get(str(session_path))
+        if entry is None or entry.mtime_ns != st.st_mtime_ns or entry.size != st.st_size:
+            return None
+        return entry
+
+    def put(
+        self,
+        session_path: Path,
+        st: os.stat_result,
+        words: frozenset[str],
+        summary: str,
+    ) -> IndexEntry:
+        """Store the indexed data for a session.
+
+        Args:
+            session_path: Path to session file
+            st: Stat result taken before the session was read
+            words: Lowercased content words
+            summary: Summary preview
+
+        Returns:
+            The stored entry
+        """
+        key = str(session_path)
+        old = self.entries.get(key)
+        if old is not None:
+            self._remove_postings(key, old.words)
+        entry = IndexEntry(st.st_mtime_ns, st.st_size, words, summary)
+        self.entries[key] = entry
+        self._add_postings(key, words)
+        self._dirty = True
+        return entry
+
+    def prune(self, live_paths: set[str]) -> set[str]:
+        """Drop entries for sessions that no longer exist.
+
+        Args:
+            live_paths: String paths of all current session files
+
+        Returns:
+            String paths of the entries that were dropped
+        """
+        stale = self.entries.keys() - live_paths
+        for key in stale:
+            self._remove_postings(key, self.entries.pop(key).words)
+        if stale:
+            self._dirty = True
+        return stale
+
+    def match_counts(self, words: Iterable[str]) -> dict[str, int]:
+        """Count how many of the given words each session contains.
+
+        Counts are accumulated from the posting lists, so sessions sharing no
+        word with the query are never visited and no per-session set
+        intersection is needed.
+
+        Args:
+            words: Distinct lowercased query words
+
+        Returns:
+            Mapping of string session path to its number of matching words,
+            for sessions matching at least one word
+        """
+        counts: dict[str, int] = {}
+        get = counts.get
+        postings = self.postings
+        for word in words:
+            for key in postings.get(word, ()):
+                counts[key] = get(key, 0) + 1
+        return counts
+
+    def _add_postings(self, key: str, words: frozenset[str]) -> None:
+        """Add a session to the posting list of each of its words."""
+        postings = self.postings
+        for word in words:
+            posting = postings.get(word)
+            if posting is None:
+                postings[word] = {key}
+            else:
+                posting.add(key)
+
+    def _remove_postings(self, key: str, words: frozenset[str]) -> None:
+        """Remove a session from the posting list of each of its words."""
+        postings = self.postings
+        for word in words:
+            posting = postings.get(word)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del postings[word]
@@ -2,22 +2,57 @@
 
 from __future__ import annotations
 
+import bisect
+import heapq
 import json
 import logging
+import mmap
+import os
 import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from .core import AnalysisResult, SessionAnalyzer
+from .core import AnalysisResult, SessionAnalyzer, _json_loads
 from .intent_analyzer import IntentAnalysisResult, IntentAnalyzer
 from .reranker import RerankingWeights, ResultReranker
+from .session_index import IndexEntry, SessionIndex
 
 logger = logging.getLogger(__name__)
 
+# Persisted search index, kept next to the sessions it describes
+INDEX_DIRNAME = ".session-search-index"
+INDEX_FILENAME = "index.pkl"
+ANALYSIS_DIRNAME = "analysis"
 
-@dataclass
+# Length of the content preview stored per session
+SUMMARY_PREVIEW_CHARS = 200
+
+# Word tokens used for query/session matching
+WORD_PATTERN = re.compile(r"\w+")
+
+# Maps every ASCII non-word character to a space, so splitting translated
+# ASCII text yields the same tokens as WORD_PATTERN without the regex engine
+ASCII_WORD_TABLE = str.maketrans(
+    {chr(c): " " for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")}
+)
+
+# Word tokens for fallback intent analysis, including CJK runs
+CONCEPT_PATTERN = re.compile(r"[\w\u4e00-\u9fff]+")
+
+# Words dropped from fallback intent concepts
+FALLBACK_STOPWORDS = frozenset(
+    {"继续", "做", "搞", "想", "要", "the", "for", "to", "a", "an", "and", "or"}
+)
+
+# Query substrings that mark a search for recent sessions
+RECENT_KEYWORDS = ("最近", "上次", "刚才", "recent", "last")
+
+
+@dataclass(slots=True)
 class SearchResult:
     """A single search result from Claude Code sessions."""
 
@@ -75,6 +110,39 @@ class SmartSearchResult:
         return self.results[:limit]
 
 
+def _find_words(text: str) -> list[str]:
+    """Split text into word tokens, equivalent to ``WORD_PATTERN.findall``.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of word tokens
+    """
+    if text.isascii():
+        return text.translate(ASCII_WORD_TABLE).split()
+    return WORD_PATTERN.findall(text)
+
+
+def _iter_lines(path: Path) -> Iterator[bytes]:
+    """Yield the raw lines of a file through a read-only memory map.
+
+    Lines are sliced straight out of the page cache instead of being copied
+    through a buffered reader; the decoder takes them as bytes.
+
+    Args:
+        path: File to read
+
+    Yields:
+        Each line, including its trailing newline
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
+
+
 class LocalSessionSearcher:
     """Search Claude Code sessions from local filesystem."""
 
@@ -86,7 +154,39 @@ class LocalSessionSearcher:
         """
         self.claude_dir = claude_dir or Path.home() / ".claude"
         self.projects_dir = self.claude_dir / "projects"
-        self.analyzer = SessionAnalyzer()
+        self.index_path = self.claude_dir / INDEX_DIRNAME / INDEX_FILENAME
+        self.index = SessionIndex(self.index_path)
+        self._index_loaded = False
+        # Session analyses are cached alongside the index, keyed by mtime and size
+        self.analyzer = SessionAnalyzer(
+            cache_dir=self.claude_dir / INDEX_DIRNAME / ANALYSIS_DIRNAME
+        )
+
+    def _scan_sessions(self) -> Iterator[os.DirEntry[str]]:
+        """Yield directory entries for session JSONL files.
+
+        Uses os.scandir so file types come from the directory listing itself
+        rather than a separate stat call per path.
+
+        Yields:
+            Directory entries for session files
+        """
+        if not self.projects_dir.exists():
+            logger.warning(f"Claude projects directory not found: {self.projects_dir}")
+            return
+
+        # Each project has its own directory with session JSONL files
+        with os.scandir(self.projects_dir) as projects:
+            for project_entry in projects:
+                if not project_entry.is_dir():
+                    continue
+                try:
+                    with os.scandir(project_entry.path) as files:
+                        for entry in files:
+                            if entry.name.endswith(".jsonl") and entry.is_file():
+                                yield entry
+                except OSError as e:
+                    logger.debug(f"Could not list project {project_entry.path}: {e}")
 
     def find_all_sessions(self) -> list[Path]:
         """Find all session JSONL files in Claude projects directory.
@@ -94,19 +194,133 @@ class LocalSessionSearcher:
         Returns:
             List of paths to session files
         """
-        sessions: list[Path] = []
+        return [Path(entry.path) for entry in self._scan_sessions()]
 
-        if not self.projects_dir.exists():
-            logger.warning(f"Claude projects directory not found: {self.projects_dir}")
-            return sessions
+    def _stat_sessions(self) -> list[tuple[Path, os.stat_result]]:
+        """Stat every session file once.
 
-        # Each project has its own directory with session JSONL files
-        for project_dir in self.projects_dir.iterdir():
-            if project_dir.is_dir():
-                for session_file in project_dir.glob("*.jsonl"):
-                    sessions.append(session_file)
+        Returns:
+            List of (path, stat result) tuples for readable sessions
+        """
+        stats: list[tuple[Path, os.stat_result]] = []
+        for entry in self._scan_sessions():
+            try:
+                stats.append((Path(entry.path), entry.stat()))
+            except OSError as e:
+                logger.debug(f"Could not stat session {entry.path}: {e}")
+        return stats
 
-        return sessions
+    def _sessions_in_window(
+        self,
+        stats: list[tuple[Path, os.stat_result]],
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[tuple[Path, os.stat_result]]:
+        """Select sessions modified within a time window.
+
+        Sessions are ordered by modification time so the window bounds can be
+        located with a binary search instead of testing every session.
+
+        Args:
+            stats: Session paths with their stat results
+            since: Only include sessions modified at or after this datetime
+            until: Only include sessions modified at or before this datetime
+
+        Returns:
+            List of (path, stat result) tuples, most recently modified first
+        """
+        ordered = sorted(stats, key=lambda x: x[1].st_mtime)
+
+        mtimes = [st.st_mtime for _, st in ordered]
+        lo = bisect.bisect_left(mtimes, since.timestamp()) if since else 0
+        hi = bisect.bisect_right(mtimes, until.timestamp()) if until else len(ordered)
+        return ordered[lo:hi][::-1]
+
+    def _index_entry(self, session_path: Path, st: os.stat_result) -> IndexEntry:
+        """Get a session's index entry, re-reading the session only if it changed.
+
+        Args:
+            session_path: Path to session JSONL file
+            st: Current stat result for the session file
+
+        Returns:
+            Index entry with the content word set and summary preview
+        """
+        entry = self.index.get(session_path, st)
+        if entry is not None:
+            return entry
+        return self.index.put(session_path, st, *self._read_index_data(session_path))
+
+    def _read_index_data(self, session_path: Path) -> tuple[frozenset[str], str]:
+        """Read a session and compute the data stored in its index entry.
+
+        Args:
+            session_path: Path to session JSONL file
+
+        Returns:
+            Tuple of (content word set, summary preview)
+        """
+        # Tokenize block by block so the full content is never joined; only
+        # enough of the leading blocks is kept to build the preview
+        tokens: set[str] = set()
+        preview_parts: list[str] = []
+        preview_len = -1  # Blocks are joined with single spaces
+        for text in self.iter_session_texts(session_path):
+            tokens.update(_find_words(text))
+            if preview_len <= SUMMARY_PREVIEW_CHARS:
+                part = text[: SUMMARY_PREVIEW_CHARS - preview_len]
+                preview_parts.append(part)
+                preview_len += len(part) + 1
+
+        # Lowercase only the distinct tokens
+        words = frozenset(map(str.lower, tokens))
+        preview = " ".join(preview_parts)
+        if len(preview) > SUMMARY_PREVIEW_CHARS:
+            preview = preview[:SUMMARY_PREVIEW_CHARS] + "..."
+        return words, preview
+
+    def _try_read_index_data(self, session_path: Path) -> tuple[frozenset[str], str] | None:
+        """Read a session's index data, or return None if it cannot be read.
+
+        Args:
+            session_path: Path to session JSONL file
+
+        Returns:
+            Tuple of (content word set, summary preview), or None on error
+        """
+        try:
+            return self._read_index_data(session_path)
+        except Exception as e:
+            logger.debug(f"Error indexing session {session_path}: {e}")
+            return None
+
+    def _refresh_index(self, sessions: list[tuple[Path, os.stat_result]]) -> None:
+        """Re-index new or modified sessions, reading them concurrently.
+
+        Session reads are dominated by file I/O and JSON decoding, so a thread
+        pool overlaps them; index updates stay on the calling thread.
+
+        Args:
+            sessions: Session paths with their current stat results
+        """
+        stale = [(path, st) for path, st in sessions if self.index.get(path, st) is None]
+        if not stale:
+            return
+
+        workers = min(len(stale), (os.cpu_count() or 1) * 2)
+        if workers <= 1:
+            for path, st in stale:
+                item = self._try_read_index_data(path)
+                if item is not None:
+                    self.index.put(path, st, *item)
+            return
+
+        # Sessions that fail to read are left unindexed and retried next search
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            data = executor.map(self._try_read_index_data, [path for path, _ in stale])
+            for (path, st), item in zip(stale, data, strict=True):
+                if item is not None:
+                    self.index.put(path, st, *item)
 
     def extract_session_id(self, session_path: Path) -> str:
         """Extract session ID from file path.
@@ -135,43 +349,46 @@ class LocalSessionSearcher:
             return project_dir.replace("-", "/")
         return project_dir
 
-    def read_session_content(self, session_path: Path) -> str:
-        """Read and concatenate all text content from a session file.
+    def iter_session_texts(self, session_path: Path) -> Iterator[str]:
+        """Yield each text block of a session file in order.
 
         Args:
             session_path: Path to session JSONL file
 
-        Returns:
-            Combined text content
+        Yields:
+            Message text blocks
         """
-        content_parts = []
-
         try:
-            with open(session_path, encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            entry = json.loads(line)
-                            # Extract text from different entry types
-                            if "message" in entry:
-                                msg = entry["message"]
-                                if isinstance(msg, dict) and "content" in msg:
-                                    msg_content = msg["content"]
-                                    if isinstance(msg_content, str):
-                                        content_parts.append(msg_content)
-                                    elif isinstance(msg_content, list):
-                                        for block in msg_content:
-                                            if (
-                                                isinstance(block, dict)
-                                                and block.get("type") == "text"
-                                            ):
-                                                content_parts.append(block.get("text", ""))
-                        except json.JSONDecodeError:
-                            continue
+            for line in _iter_lines(session_path):
+                if line.strip():
+                    try:
+                        entry = _json_loads(line)
+                        # Extract text from different entry types
+                        if "message" in entry:
+                            msg = entry["message"]
+                            if isinstance(msg, dict) and "content" in msg:
+                                msg_content = msg["content"]
+                                if isinstance(msg_content, str):
+                                    yield msg_content
+                                elif isinstance(msg_content, list):
+                                    for block in msg_content:
+                                        if isinstance(block, dict) and block.get("type") == "text":
+                                            yield block.get("text", "")
+                    except ValueError:  # invalid JSON or invalid UTF-8
+                        continue
         except Exception as e:
             logger.debug(f"Error reading session {session_path}: {e}")
 
-        return " ".join(content_parts)
+    def read_session_content(self, session_path: Path) -> str:
+        """Read and concatenate all text content from a session file.
+
+        Args:
+            session_path: Path to session JSONL file
+
+        Returns:
+            Combined text content
+        """
+        return " ".join(self.iter_session_texts(session_path))
 
     def search(
         self,
@@ -180,6 +397,7 @@ class LocalSessionSearcher:
         limit: int = 10,
         since: datetime | None = None,
         until: datetime | None = None,
+        deep: bool = False,
     ) -> list[SearchResult]:
         """Search for sessions matching the query.
 
@@ -189,6 +407,9 @@ class LocalSessionSearcher:
             limit: Maximum number of results
             since: Filter sessions modified after this datetime
             until: Filter sessions modified before this datetime
+            deep: Fill goals, actions and outcome by analyzing each returned
+                session. When False, results carry only the content preview;
+                see ``analyze_result``.
 
         Returns:
             List of SearchResult objects
@@ -198,92 +419,99 @@ class LocalSessionSearcher:
             query = " ".join(query)
 
         query_lower = query.lower()
-        query_words = set(re.findall(r"\w+", query_lower))
+        query_words = frozenset(_find_words(query_lower))
 
         # If no query words, return all sessions (filtered by time if specified)
         list_all_mode = not query_words
 
-        results: list[tuple[float, SearchResult]] = []
-        sessions = self.find_all_sessions()
+        if not self._index_loaded:
+            self.index.load()
+            self._index_loaded = True
 
-        for session_path in sessions:
-            try:
-                # Read session content
-                content = self.read_session_content(session_path)
-                content_lower = content.lower()
+        stats = self._stat_sessions()
+        sessions = self._sessions_in_window(stats, since, until)
 
-                # Calculate simple similarity score
-                content_words = set(re.findall(r"\w+", content_lower))
-                common_words = query_words & content_words
+        if list_all_mode:
+            # Sessions arrive newest first, so listing stops at the limit
+            ranked = [(1.0, path, st) for path, st in sessions[:limit]]
+        else:
+            # Bring the index up to date, then score only sessions whose
+            # posting lists share a word with the query
+            self._refresh_index(sessions)
+            match_counts = self.index.match_counts(query_words)
+
+            # Similarity depends only on the match count, so score every
+            # possible count once: Jaccard-like ratio, boosted for multiple matches
+            n_query = len(query_words)
+            scores = [c / n_query * (1.5 if c > 1 else 1.0) for c in range(n_query + 1)]
+
+            scored = [
+                (scores[match_counts[str(path)]], path, st)
+                for path, st in sessions
+                if str(path) in match_counts
+            ]
+            # Select the top results by similarity without sorting every match
+            ranked = heapq.nlargest(limit, scored, key=lambda x: x[0])
+
+        # Summaries and analysis are only built for the returned sessions
+        results: list[SearchResult] = []
+        for similarity, session_path, st in ranked:
+            try:
+                result = self._build_result(session_path, st, similarity)
+                if deep:
+                    self.analyze_result(result)
+                results.append(result)
+            except Exception as e:
+                logger.debug(f"Error processing session {session_path}: {e}")
 
-                # Skip if no match (unless listing all sessions)
-                if not list_all_mode and not common_words:
-                    continue
+        # Forget deleted sessions and persist any newly indexed ones
+        removed = self.index.prune({str(path) for path, _ in stats})
+        self.analyzer.discard_cached(removed)
+        self.index.save()
 
-                # Jaccard-like similarity with boost for multiple matches
-                if list_all_mode:
-                    # In list all mode, sort by timestamp (most recent first)
-                    similarity = 1.0
-                else:
-                    similarity = len(common_words) / max(len(query_words), 1)
-                    # Boost score if multiple query words match
-                    if len(common_words) > 1:
-                        similarity *= 1.5
-
-                # Get session metadata using the analyzer
-                session_id = self.extract_session_id(session_path)
-                project_path = self.extract_project_name(session_path)
-
-                # Try to analyze the session for goals/actions
-                goals: list[str] = []
-                actions: list[str] = []
-                outcome = ""
-                summary = content[:200] + "..." if len(content) > 200 else content
+        return results
 
-                try:
-                    analysis: AnalysisResult = self.analyzer.analyze(session_path)
-                    goals = analysis.goals
-                    actions = analysis.actions
-                    outcome = analysis.outcome or ""
-                    if analysis.summary:
-                        summary = analysis.summary
-                except Exception as e:
-                    logger.debug(f"Could not analyze session {session_id}: {e}")
-
-                # Get file modification time as timestamp
-                timestamp = datetime.fromtimestamp(session_path.stat().st_mtime)
-
-                # Apply time filtering
-                if since and timestamp < since:
-                    continue
-                if until and timestamp > until:
-                    continue
+    def _build_result(
+        self, session_path: Path, st: os.stat_result, similarity: float
+    ) -> SearchResult:
+        """Build a search result from the session's index entry.
 
-                result = SearchResult(
-                    session_id=session_id,
-                    project_path=project_path,
-                    summary=summary,
-                    timestamp=timestamp,
-                    similarity=min(similarity, 1.0),  # Cap at 1.0
-                    goals=goals,
-                    actions=actions,
-                    outcome=outcome,
-                )
+        Args:
+            session_path: Path to session JSONL file
+            st: Current stat result for the session file
+            similarity: Uncapped similarity score
 
-                results.append((similarity, result))
+        Returns:
+            SearchResult with the content preview as summary
+        """
+        return SearchResult(
+            session_id=self.extract_session_id(session_path),
+            project_path=self.extract_project_name(session_path),
+            # Preview comes from the persisted index
+            summary=self._index_entry(session_path, st).summary,
+            # File modification time is the session timestamp
+            timestamp=datetime.fromtimestamp(st.st_mtime),
+            similarity=min(similarity, 1.0),  # Cap at 1.0
+            metadata={"session_path": str(session_path)},
+        )
 
-            except Exception as e:
-                logger.debug(f"Error processing session {session_path}: {e}")
-                continue
+    def analyze_result(self, result: SearchResult) -> None:
+        """Fill a result's goals, actions, outcome and summary from its session.
 
-        # Sort by similarity (descending) or by timestamp (most recent first) when listing all
-        if list_all_mode:
-            results.sort(key=lambda x: x[1].timestamp or datetime.min, reverse=True)
-        else:
-            results.sort(key=lambda x: x[0], reverse=True)
+        Args:
+            result: Result returned by ``search``; updated in place
+        """
+        try:
+            analysis: AnalysisResult = self.analyzer.analyze(result.metadata["session_path"])
+        except Exception as e:
+            logger.debug(f"Could not analyze session {result.session_id}: {e}")
+            return
 
-        # Return top results
-        return [r for _, r in results[:limit]]
+        result.goals = analysis.goals
+        result.actions = analysis.actions
+        result.outcome = analysis.outcome or ""
+        if analysis.summary:
+            result.summary = analysis.summary
 
 
 class SmartSearch:
@@ -374,6 +602,7 @@ class SmartSearch:
             raw_results = self.local_searcher.search(
                 query=result.intent.concepts,
                 limit=fetch_limit,
+                deep=False,
             )
             result.total_found = len(raw_results)
             logger.info(f"Local search returned {len(raw_results)} results")
@@ -390,21 +619,25 @@ class SmartSearch:
             )
             result.results = result.results[:limit]
 
+            # Analyze only the sessions that made the final cut
+            for r in result.results:
+                self.local_searcher.analyze_result(r)
+
         result.search_time_ms = (time.time() - start_time) * 1000
 
         return result
 
     def _fallback_intent_analysis(self, query: str) -> IntentAnalysisResult:
         """Fallback intent analysis when LLM is not available."""
-        # Simple keyword extraction
-        stopwords = {"继续", "做", "搞", "想", "要", "the", "for", "to", "a", "an", "and", "or"}
-        words = re.findall(r"[\w\u4e00-\u9fff]+", query.lower())
-
-        concepts = [w for w in words if w not in stopwords and len(w) > 1][:5]
+        # Simple keyword extraction, deduplicated in query order
+        words = CONCEPT_PATTERN.findall(query.lower())
+        concepts = list(
+            dict.fromkeys(w for w in words if w not in FALLBACK_STOPWORDS and len(w) > 1)
+        )[:5]
 
         # Detect time hint
         time_hint = "all_time"
-        if any(kw in query for kw in ["最近", "上次", "刚才", "recent", "last"]):
+        if any(kw in query for kw in RECENT_KEYWORDS):
             time_hint = "recent"
 
         return IntentAnalysisResult(
@@ -491,4 +724,4 @@ def quick_search(
     """
     # Use LocalSessionSearcher directly for time filtering support
     searcher = LocalSessionSearcher()
-    return searcher.search(query, limit=limit, since=since, until=until)
+    return searcher.search(query, limit=limit, since=since, until=until, deep=True)
@@ -4,12 +4,61 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import heapq
 import json
+import os
+import pickle
 import re
 import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
+from typing import TypeVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+# Fastest available JSON decoder; both raise ValueError subclasses on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Word tokens used for query/session matching
+WORD_PATTERN = re.compile(r"\w+")
+
+# Relative dates such as '7d', '14days' or '1day'
+RELATIVE_DAYS_PATTERN = re.compile(r"(\d+)\s*d(?:ays?)?")
+
+# Maps every ASCII non-word character to a space and every uppercase letter
+# to lowercase, so splitting translated ASCII text yields the same tokens as
+# WORD_PATTERN on the lowered text, in one pass and without the regex engine
+ASCII_WORD_TABLE = str.maketrans(
+    {chr(c): chr(c).lower() if chr(c).isalnum() or chr(c) == "_" else " " for c in range(128)}
+)
+
+# Length of the content preview shown per session
+SUMMARY_CHARS = 200
+
+# Token cache reused across runs, keyed by session path, mtime and size
+CACHE_FILE = Path.home() / ".claude" / ".session-search-index" / "tokens.pkl"
+CACHE_VERSION = 1
+
+# Very long sessions (mostly pasted tool output) are only read this far;
+# their opening is what identifies them
+MAX_SESSION_CHARS = 64 * 1024 * 1024
+
+# Read size for the raw byte prefilter
+SCAN_CHUNK_BYTES = 1 << 20
+
+# Below this many sessions to (re)read, a process pool costs more than it saves
+PARALLEL_MIN_SESSIONS = 16
 
 
 @dataclass
@@ -26,12 +75,25 @@ class SearchResult:
     outcome: str = ""
 
 
+def find_lower_words(text: str) -> list[str]:
+    """Split text into lowercased word tokens.
+
+    Equivalent to ``WORD_PATTERN.findall(text.lower())``, but ASCII text is
+    lowercased and split in a single ``str.translate`` pass instead of first
+    building a lowered copy of the whole block.
+    """
+    if text.isascii():
+        return text.translate(ASCII_WORD_TABLE).split()
+    return WORD_PATTERN.findall(text.lower())
+
+
 def parse_date(date_str: str, end_of_day: bool = False) -> datetime | None:
     """Parse date string to datetime.
 
     Supports:
     - YYYY-MM-DD format
-    - Relative dates: 'yesterday', 'today', '7days', '30days', etc.
+    - Relative dates: 'yesterday', 'today', 'week', 'month', or any
+      number of days such as '7d', '14days'.
 
     Args:
         date_str: Date string to parse
@@ -48,6 +110,11 @@ def parse_date(date_str: str, end_of_day: bool = False) -> datetime | None:
         base = today - timedelta(days=7)
     elif date_str == "month" or date_str == "30days":
         base = today - timedelta(days=30)
+    elif match := RELATIVE_DAYS_PATTERN.fullmatch(date_str):
+        try:
+            base = today - timedelta(days=int(match.group(1)))
+        except (OverflowError, ValueError):
+            return None
     else:
         try:
             base = datetime.strptime(date_str, "%Y-%m-%d")
@@ -59,20 +126,49 @@ def parse_date(date_str: str, end_of_day: bool = False) -> datetime | None:
     return base
 
 
-def find_all_sessions(claude_dir: Path) -> list[Path]:
-    """Find all session JSONL files in Claude projects directory."""
+def list_project_sessions(project_dir: str) -> list[tuple[Path, os.stat_result]]:
+    """List session JSONL files in one project directory with their stat results."""
     sessions = []
+    try:
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jsonl"):
+                    continue
+                try:
+                    # is_file() reuses the directory entry's type; stat() is
+                    # cached on the entry, so each file is stat'ed once
+                    if entry.is_file():
+                        sessions.append((Path(entry.path), entry.stat()))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return sessions
+
+
+def find_all_sessions(claude_dir: Path) -> list[tuple[Path, os.stat_result]]:
+    """Find all session JSONL files in Claude projects directory.
+
+    Project directories are listed and their sessions stat'ed concurrently,
+    since each listing mostly waits on the filesystem.
+
+    Returns:
+        List of (session path, stat result) pairs
+    """
     projects_dir = claude_dir / "projects"
 
-    if not projects_dir.exists():
-        return sessions
+    try:
+        with os.scandir(projects_dir) as entries:
+            project_dirs = [entry.path for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
 
-    for project_dir in projects_dir.iterdir():
-        if project_dir.is_dir():
-            for session_file in project_dir.glob("*.jsonl"):
-                sessions.append(session_file)
+    if len(project_dirs) <= 1:
+        return list(chain.from_iterable(map(list_project_sessions, project_dirs)))
 
-    return sessions
+    workers = min(32, (os.cpu_count() or 1) * 4, len(project_dirs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(chain.from_iterable(executor.map(list_project_sessions, project_dirs)))
 
 
 def extract_session_id(session_path: Path) -> str:
@@ -84,36 +180,231 @@ def extract_project_name(session_path: Path) -> str:
     """Extract project name from session path."""
     project_dir = session_path.parent.name
     if project_dir.startswith("-"):
-        return project_dir.replace("-", "/")
-    return project_dir
+        project_dir = project_dir.replace("-", "/")
+    # Sessions of one project share a single string
+    return sys.intern(project_dir)
 
 
-def read_session_content(session_path: Path) -> str:
-    """Read and concatenate all text content from a session file."""
-    content_parts = []
+def iter_session_texts(session_path: Path) -> Iterator[str]:
+    """Yield each text part of a session file in order.
 
+    Lines are streamed one at a time, and reading stops once
+    MAX_SESSION_CHARS have been consumed.
+    """
+    remaining = MAX_SESSION_CHARS
     try:
         with open(session_path, encoding="utf-8") as f:
             for line in f:
-                if line.strip():
+                remaining -= len(line)
+                if remaining < 0:
+                    break
+                # Only entries with a message carry text; skip the rest unparsed
+                if '"message"' in line:
                     try:
-                        entry = json.loads(line)
+                        entry = _json_loads(line)
                         if "message" in entry:
                             msg = entry["message"]
                             if isinstance(msg, dict) and "content" in msg:
                                 msg_content = msg["content"]
                                 if isinstance(msg_content, str):
-                                    content_parts.append(msg_content)
+                                    yield msg_content
                                 elif isinstance(msg_content, list):
                                     for block in msg_content:
                                         if isinstance(block, dict) and block.get("type") == "text":
-                                            content_parts.append(block.get("text", ""))
-                    except json.JSONDecodeError:
+                                            yield block.get("text", "")
+                    except ValueError:
                         continue
     except Exception:
         pass
 
-    return " ".join(content_parts)
+
+def read_session_content(session_path: Path) -> str:
+    """Read and concatenate all text content from a session file."""
+    return " ".join(iter_session_texts(session_path))
+
+
+def join_summary(parts: list[str]) -> str:
+    """Join leading text parts into a summary capped at SUMMARY_CHARS.
+
+    Parts only need to cover one character past the cap, so callers slice
+    each text block rather than keeping it whole.
+    """
+    content = " ".join(parts)
+    return content[:SUMMARY_CHARS] + "..." if len(content) > SUMMARY_CHARS else content
+
+
+@functools.lru_cache(maxsize=8)
+def query_pattern(query_words: frozenset[str]) -> re.Pattern[str]:
+    """Compile one regex matching any query word as a whole word token.
+
+    Scanning non-ASCII text for the query words directly is cheaper than
+    tokenizing all of it; ASCII text is still split with str.translate,
+    which beats both.
+    """
+    alternation = "|".join(re.escape(word) for word in sorted(query_words))
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)")
+
+
+def may_contain_any(session_path: Path, query_words: frozenset[str]) -> bool:
+    """Cheaply check whether a session could contain any of the query words.
+
+    An ASCII word can only appear in the text if its bytes appear in the
+    lowercased raw file, so sessions failing this byte scan are skipped
+    without JSON-parsing a single line. Non-ASCII words may be escaped in
+    the JSON, so they always pass. The file is scanned in fixed-size chunks,
+    bounding memory and stopping at the first hit.
+    """
+    if not query_words or not all(word.isascii() for word in query_words):
+        return True
+
+    needles = [word.encode() for word in query_words]
+    # Carry the end of each chunk over so words spanning a boundary are found
+    overlap = max(map(len, needles)) - 1
+    tail = b""
+    try:
+        with open(session_path, "rb") as f:
+            while chunk := f.read(SCAN_CHUNK_BYTES):
+                data = tail + chunk.lower()
+                if any(needle in data for needle in needles):
+                    return True
+                tail = data[len(data) - overlap :]
+    except OSError:
+        return True
+    return False
+
+
+def read_and_score(session_path: Path, query_words: frozenset[str]) -> tuple[int, str]:
+    """Count matching query words and build a summary in one streaming pass.
+
+    Reading stops as soon as every query word has been seen and the summary
+    is complete, so long sessions are rarely read to the end.
+
+    Returns:
+        Tuple of (number of query words found, summary)
+    """
+    if not may_contain_any(session_path, query_words):
+        return 0, ""
+
+    pattern = query_pattern(query_words)
+    matched: set[str] = set()
+    summary_parts: list[str] = []
+    summary_len = -1  # Parts are joined with single spaces
+
+    for text in iter_session_texts(session_path):
+        if summary_len <= SUMMARY_CHARS:
+            part = text[: SUMMARY_CHARS - summary_len]
+            summary_parts.append(part)
+            summary_len += len(part) + 1
+        if len(matched) < len(query_words):
+            if text.isascii():
+                matched.update(query_words.intersection(find_lower_words(text)))
+            else:
+                matched.update(pattern.findall(text.lower()))
+        if len(matched) == len(query_words) and summary_len > SUMMARY_CHARS:
+            break
+
+    return len(matched), join_summary(summary_parts)
+
+
+def prefetch_sessions(paths: list[Path]) -> None:
+    """Ask the kernel to start reading session files into the page cache.
+
+    POSIX_FADV_WILLNEED only queues read-ahead and returns, so the files are
+    fetched in the background while the first ones are processed. A no-op
+    where ``os.posix_fadvise`` is unavailable; errors are ignored, since the
+    hint only affects speed.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def map_sessions(func: Callable[[Path], T], paths: list[Path]) -> list[T]:
+    """Apply a per-session function, across processes when there are many."""
+    if len(paths) < PARALLEL_MIN_SESSIONS:
+        return list(map(func, paths))
+    prefetch_sessions(paths)
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(func, paths, chunksize=4))
+
+
+def index_session(session_path: Path) -> tuple[frozenset[str], str]:
+    """Read a session fully and return its lowercased word set and summary."""
+    words: set[str] = set()
+    summary_parts: list[str] = []
+    summary_len = -1  # Parts are joined with single spaces
+
+    for text in iter_session_texts(session_path):
+        words.update(find_lower_words(text))
+        if summary_len <= SUMMARY_CHARS:
+            part = text[: SUMMARY_CHARS - summary_len]
+            summary_parts.append(part)
+            summary_len += len(part) + 1
+
+    return frozenset(words), join_summary(summary_parts)
+
+
+def load_cache() -> dict[str, tuple[int, int, frozenset[str], str]]:
+    """Load the token cache, returning an empty one if missing or stale."""
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            data = pickle.load(f)
+        if data.get("version") == CACHE_VERSION:
+            return data["entries"]
+    except Exception:
+        pass
+    return {}
+
+
+def save_cache(entries: dict[str, tuple[int, int, frozenset[str], str]]) -> None:
+    """Atomically write the token cache, ignoring failures."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_FILE.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                data = {"version": CACHE_VERSION, "entries": entries}
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, CACHE_FILE)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+def refresh_cache(
+    cache: dict[str, tuple[int, int, frozenset[str], str]],
+    sessions: list[tuple[Path, os.stat_result]],
+) -> bool:
+    """Re-read sessions whose mtime or size changed, in parallel when many.
+
+    Returns:
+        True if any cache entry was added or replaced
+    """
+    stale = []
+    for path, st in sessions:
+        entry = cache.get(str(path))
+        if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+            stale.append((path, st))
+    if not stale:
+        return False
+
+    indexed = map_sessions(index_session, [path for path, _ in stale])
+
+    for (path, st), (words, summary) in zip(stale, indexed, strict=True):
+        cache[str(path)] = (st.st_mtime_ns, st.st_size, words, summary)
+    return True
 
 
 def search_sessions(
@@ -121,72 +412,97 @@ def search_sessions(
     limit: int = 5,
     since: datetime | None = None,
     until: datetime | None = None,
+    use_cache: bool = True,
+    min_size: int = 0,
 ) -> list[SearchResult]:
-    """Search for sessions matching the query."""
+    """Search for sessions matching the query.
+
+    Sessions outside the ``since``/``until`` window or smaller than
+    ``min_size`` bytes are dropped from their stat results, before any
+    content is read.
+
+    With ``use_cache``, session word sets are kept in ``CACHE_FILE`` so only
+    new or modified sessions are read; otherwise each session is streamed and
+    read only until every query word has been found.
+    """
     claude_dir = Path.home() / ".claude"
 
-    query_lower = query.lower()
-    query_words = set(re.findall(r"\w+", query_lower))
+    query_words = frozenset(find_lower_words(query))
 
     # If no query words, list all sessions (filtered by time if specified)
     list_all_mode = not query_words
 
-    results: list[tuple[float, SearchResult]] = []
-    sessions = find_all_sessions(claude_dir)
-
-    for session_path in sessions:
-        try:
-            content = read_session_content(session_path)
-            content_lower = content.lower()
-
-            content_words = set(re.findall(r"\w+", content_lower))
-            common_words = query_words & content_words
-
-            # Skip if no match (unless listing all sessions)
-            if not list_all_mode and not common_words:
-                continue
-
-            timestamp = datetime.fromtimestamp(session_path.stat().st_mtime)
-
-            # Apply time filtering
-            if since and timestamp < since:
-                continue
-            if until and timestamp > until:
-                continue
-
-            # Calculate similarity
-            if list_all_mode:
-                similarity = 1.0
-            else:
-                similarity = len(common_words) / max(len(query_words), 1)
-                if len(common_words) > 1:
-                    similarity *= 1.5
-
-            session_id = extract_session_id(session_path)
-            project_path = extract_project_name(session_path)
+    # Min-heap of the best (rank key, -position, similarity) seen so far; the
+    # negated position makes earlier sessions win ties, as a stable sort would
+    top: list[tuple[float, int, float]] = []
+    since_ts = since.timestamp() if since else None
+    until_ts = until.timestamp() if until else None
+
+    # Apply size and time filtering from the stat result before reading content
+    all_sessions = find_all_sessions(claude_dir)
+    sessions: list[tuple[Path, os.stat_result]] = []
+    for session_path, st in all_sessions:
+        if st.st_size < min_size:
+            continue
+        if since_ts is not None and st.st_mtime < since_ts:
+            continue
+        if until_ts is not None and st.st_mtime > until_ts:
+            continue
+        sessions.append((session_path, st))
+
+    if use_cache:
+        cache = load_cache()
+        changed = refresh_cache(cache, sessions)
+        # Forget sessions that have been deleted since the cache was written
+        stale_keys = cache.keys() - {str(path) for path, _ in all_sessions}
+        for key in stale_keys:
+            del cache[key]
+        if changed or stale_keys:
+            save_cache(cache)
+        entries = [cache[str(path)] for path, _ in sessions]
+        scored = [(len(query_words & words), summary) for _, _, words, summary in entries]
+    else:
+        # Stream and score every session, in worker processes when there are many
+        score = functools.partial(read_and_score, query_words=query_words)
+        scored = map_sessions(score, [path for path, _ in sessions])
 
-            summary = content[:200] + "..." if len(content) > 200 else content
+    for position, (common_count, _) in enumerate(scored):
+        # Skip if no match (unless listing all sessions)
+        if not list_all_mode and not common_count:
+            continue
 
+        # Calculate similarity
+        if list_all_mode:
+            similarity = 1.0
+        else:
+            similarity = common_count / max(len(query_words), 1)
+            if common_count > 1:
+                similarity *= 1.5
+
+        # Keep only the best `limit` candidates, ranked by similarity or by
+        # recency when listing; results are built for the survivors only
+        key = sessions[position][1].st_mtime if list_all_mode else similarity
+        item = (key, -position, similarity)
+        if len(top) < limit:
+            heapq.heappush(top, item)
+        elif top and item > top[0]:
+            heapq.heapreplace(top, item)
+
+    results = []
+    for _, neg_position, similarity in sorted(top, reverse=True):
+        session_path, st = sessions[-neg_position]
+        try:
             result = SearchResult(
-                session_id=session_id,
-                project_path=project_path,
-                summary=summary,
-                timestamp=timestamp,
+                session_id=extract_session_id(session_path),
+                project_path=extract_project_name(session_path),
+                summary=scored[-neg_position][1],
+                timestamp=datetime.fromtimestamp(st.st_mtime),
                 similarity=min(similarity, 1.0),
             )
-
-            results.append((similarity, result))
-
         except Exception:
             continue
-
-    # Sort by similarity or timestamp
-    if list_all_mode:
-        results.sort(key=lambda x: x[1].timestamp or datetime.min, reverse=True)
-    else:
-        results.sort(key=lambda x: x[0], reverse=True)
-
-    return [r for _, r in results[:limit]]
+        results.append(result)
+    return results
 
 
 def format_results(results: list[SearchResult], query: str, time_desc: str = "") -> str:
@@ -249,7 +565,7 @@ def main():
     parser.add_argument(
         "--since",
         type=str,
-        help="Start date (YYYY-MM-DD or 'yesterday', '7days', etc.)",
+        help="Start date (YYYY-MM-DD or 'yesterday', '7d', '30days', etc.)",
     )
     parser.add_argument(
         "--until",
@@ -261,6 +577,17 @@ def main():
         action="store_true",
         help="List all sessions",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Read every session instead of using the token cache",
+    )
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        default=0,
+        help="Skip session files smaller than this many bytes (default: 0)",
+    )
 
     args = parser.parse_args()
 
@@ -281,7 +608,14 @@ def main():
         time_desc = f" ({', '.join(parts)})"
 
     try:
-        results = search_sessions(query, limit=limit, since=since, until=until)
+        results = search_sessions(
+            query,
+            limit=limit,
+            since=since,
+            until=until,
+            use_cache=not args.no_cache,
+            min_size=args.min_size,
+        )
         output = format_results(results, query, time_desc)
         print(output)
     except Exception as e:
@@ -0,0 +1,27 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from datetime import datetime, tzinfo
+
+import pytest
+
+import analyzer.reranker
+
+# Fixed reference time for tests that depend on the clock
+NOW = datetime(2024, 6, 1, 12, 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns NOW."""
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]
+        return NOW.replace(tzinfo=tz)
+
+
+@pytest.fixture
+def now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Freeze the reranker's clock at NOW and return it."""
+    monkeypatch.setattr(analyzer.reranker, "datetime", _FrozenDatetime)
+    return NOW
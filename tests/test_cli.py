@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import json
 import tempfile
+from datetime import datetime, timedelta
 from io import StringIO
 from pathlib import Path
 from unittest.mock import patch
 
-from analyzer.cli import format_result, main
+import pytest
+
+from analyzer import cli
+from analyzer.cli import format_result, main, parse_date
 from analyzer.core import AnalysisResult
+from analyzer.smart_search import SearchResult
 
 
 class TestFormatResult:
@@ -89,6 +94,83 @@ class TestFormatResult:
         assert "**Outcome:** partial" in output
 
 
+class TestParseDate:
+    """Tests for parse_date function."""
+
+    def test_iso_date(self) -> None:
+        """Test YYYY-MM-DD dates parse to midnight."""
+        assert parse_date("2026-02-16") == datetime(2026, 2, 16)
+
+    def test_iso_date_end_of_day(self) -> None:
+        """Test end_of_day moves to the last second of the day."""
+        assert parse_date("2026-02-16", end_of_day=True) == datetime(2026, 2, 16, 23, 59, 59)
+
+    def test_unpadded_date(self) -> None:
+        """Test dates without zero padding are still accepted."""
+        assert parse_date("2026-2-1") == datetime(2026, 2, 1)
+
+    def test_relative_dates(self) -> None:
+        """Test relative keywords resolve against today."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        assert parse_date("today") == today
+        assert parse_date(" Yesterday ") == today - timedelta(days=1)
+        assert parse_date("7days") == parse_date("week") == today - timedelta(days=7)
+        assert parse_date("30days") == parse_date("month") == today - timedelta(days=30)
+
+    def test_invalid_date(self) -> None:
+        """Test unparseable input returns None."""
+        assert parse_date("not-a-date") is None
+        assert parse_date("2026-13-01") is None
+        # Compact and week forms accepted by date.fromisoformat stay rejected
+        assert parse_date("20260216") is None
+        assert parse_date("2026-W07-1") is None
+
+
+class TestDumpJson:
+    """Tests for JSON serialization helper."""
+
+    def test_datetime_serialized_as_isoformat(self) -> None:
+        """Test datetimes are emitted as ISO strings."""
+        ts = datetime(2026, 2, 16, 14, 32, 5)
+        data = json.loads(cli._dump_json({"timestamp": ts, "name": "认证"}))
+        assert data == {"timestamp": "2026-02-16T14:32:05", "name": "认证"}
+
+    def test_stdlib_fallback_matches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test output is identical without orjson installed."""
+        obj = [{"goals": ["实现认证"], "confidence": 0.85, "timestamp": datetime(2026, 2, 16)}]
+        fast = cli._dump_json(obj)
+        monkeypatch.setattr(cli, "orjson", None)
+        assert cli._dump_json(obj) == fast
+
+    def test_stream_json_array_matches_dump(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test streamed arrays are byte-identical to dumping the full list."""
+        items = [{"file": "a.jsonl", "goals": ["实现认证"]}, {"file": "b.jsonl", "goals": []}]
+        cli._stream_json_array(iter(items))
+        assert capsys.readouterr().out == json.dumps(items, ensure_ascii=False, indent=2) + "\n"
+
+    def test_stream_json_array_empty(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test streaming no items writes an empty array."""
+        cli._stream_json_array([])
+        assert capsys.readouterr().out == "[]\n"
+
+
+class TestPlainConsole:
+    """Tests for the non-terminal console."""
+
+    def test_strips_markup(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test markup tags are removed but bracketed text is kept."""
+        cli._PlainConsole().print(
+            "[bold]1[/bold]. [cyan][abc123][/cyan] [bold green]ok[/bold green]"
+        )
+        assert capsys.readouterr().out == "1. [abc123] ok\n"
+
+    def test_used_for_piped_output(self) -> None:
+        """Test non-table formats skip Rich when stdout is not a terminal."""
+        with patch("sys.stdout", new_callable=StringIO):
+            assert isinstance(cli._make_console("text"), cli._PlainConsole)
+            assert not isinstance(cli._make_console("table"), cli._PlainConsole)
+
+
 class TestCLI:
     """Tests for CLI commands."""
 
@@ -97,11 +179,20 @@ class TestCLI:
         result = main([])
         assert result == 0
 
+    def test_parser_built_once(self) -> None:
+        """Test the argument parser is cached between invocations."""
+        main([])
+        parser = cli._PARSER
+        main([])
+        assert parser is not None
+        assert cli._PARSER is parser
+
     def test_analyze_nonexistent_file(self) -> None:
         """Test analyzing non-existent file returns error."""
         result = main(["analyze", "/nonexistent/file.jsonl"])
         assert result == 1
 
+    @pytest.mark.filesystem
     def test_analyze_single_file_json_format(self) -> None:
         """Test analyzing single file with JSON output."""
         # Create temporary session file
@@ -122,6 +213,7 @@ class TestCLI:
         finally:
             Path(temp_path).unlink()
 
+    @pytest.mark.filesystem
     def test_analyze_table_format(self) -> None:
         """Test analyzing with table format."""
         content = json.dumps({"text": "实现认证功能。成功完成了。"})
@@ -143,6 +235,7 @@ class TestCLI:
         finally:
             Path(temp_path).unlink()
 
+    @pytest.mark.filesystem
     def test_analyze_multiple_files(self) -> None:
         """Test analyzing multiple files."""
         content1 = json.dumps({"text": "实现认证功能。"})
@@ -167,6 +260,67 @@ class TestCLI:
             Path(temp_path1).unlink()
             Path(temp_path2).unlink()
 
+    @pytest.mark.filesystem
+    def test_analyze_multiple_files_preserves_order(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test parallel analysis reports files in the order given."""
+        paths = []
+        for i in range(3):
+            session_file = tmp_path / f"session_{i}.jsonl"
+            session_file.write_text(json.dumps({"text": f"实现功能{i}。成功完成。"}))
+            paths.append(str(session_file))
+
+        result = main(["analyze", *paths, "-f", "json"])
+        assert result == 0
+
+        data = json.loads(capsys.readouterr().out)
+        assert [d["file"] for d in data] == [
+            "session_0.jsonl",
+            "session_1.jsonl",
+            "session_2.jsonl",
+        ]
+
+    @pytest.mark.filesystem
+    def test_analyze_error_names_failing_file(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a failing file in a batch is named in the error message."""
+        good = tmp_path / "good.jsonl"
+        bad = tmp_path / "bad.jsonl"
+        for path in (good, bad):
+            path.write_text(json.dumps({"text": "实现功能。成功完成。"}))
+        real_analyze = cli.SessionAnalyzer.analyze
+
+        def analyze(self: cli.SessionAnalyzer, session_path: str | Path) -> AnalysisResult:
+            if Path(session_path) == bad:
+                raise ValueError("boom")
+            return real_analyze(self, session_path)
+
+        with patch.object(cli.SessionAnalyzer, "analyze", analyze):
+            assert main(["analyze", str(good), str(bad), "-f", "text"]) == 1
+
+        assert f"Error analyzing {bad}: boom" in capsys.readouterr().out
+
+    def test_search_json_format(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test search JSON output includes ISO timestamps."""
+        results = [
+            SearchResult(
+                session_id="abc123",
+                project_path="/p",
+                summary="Test",
+                timestamp=datetime(2026, 2, 16, 14, 32),
+                similarity=0.9,
+            )
+        ]
+        with patch("analyzer.cli.quick_search", return_value=results):
+            assert main(["search", "test", "-f", "json"]) == 0
+
+        data = json.loads(capsys.readouterr().out)
+        assert data[0]["session_id"] == "abc123"
+        assert data[0]["timestamp"] == "2026-02-16T14:32:00"
+
+    @pytest.mark.filesystem
     def test_analyze_text_format(self) -> None:
         """Test analyzing with default text format."""
         content = json.dumps({"text": "实现认证功能。成功完成了。"})
@@ -186,6 +340,7 @@ class TestCLI:
         finally:
             Path(temp_path).unlink()
 
+    @pytest.mark.filesystem
     def test_analyze_markdown_format(self) -> None:
         """Test analyzing with markdown format."""
         content = json.dumps({"text": "实现认证功能。"})
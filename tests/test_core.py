@@ -7,10 +7,12 @@ import os
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from analyzer.core import AnalysisResult, SessionAnalyzer
+from analyzer import core
+from analyzer.core import AnalysisResult, SessionAnalyzer, _tokenize
 
 
 @pytest.fixture
@@ -79,6 +81,27 @@ class TestSessionAnalyzer:
         assert len(actions) > 0
         assert any("AuthModule.ts" in a for a in actions)
 
+    def test_extract_goals_and_actions_stops_at_caps(self, analyzer: SessionAnalyzer) -> None:
+        """Test sentences after both caps are reached are not segmented."""
+        text = "。".join(f"实现功能{i}并运行测试{i}" for i in range(20))
+
+        with patch("analyzer.core._tokenize", wraps=_tokenize) as mock_tokenize:
+            goals, actions = analyzer._extract_goals_and_actions(text)
+
+        assert len(goals) == 3
+        assert len(actions) == 5
+        assert mock_tokenize.call_count == 5
+
+    def test_extract_goals_and_actions(self, analyzer: SessionAnalyzer) -> None:
+        """Test the single-pass extractor agrees with the individual ones."""
+        text = "请帮我实现登录功能。我修改了 AuthModule.ts 文件，并运行了测试。"
+        goals, actions = analyzer._extract_goals_and_actions(text)
+
+        assert goals == analyzer._extract_goals(text, [])
+        assert actions == analyzer._extract_actions(text, [])
+        assert any("登录" in g for g in goals)
+        assert any("AuthModule.ts" in a for a in actions)
+
     def test_determine_outcome_success(self, analyzer: SessionAnalyzer) -> None:
         """Test outcome determination for success case."""
         text = "所有测试通过，成功完成了任务。"
@@ -129,6 +152,7 @@ class TestSessionAnalyzer:
         assert "【行动】" in summary
         assert "【结果】" in summary
 
+    @pytest.mark.filesystem
     def test_analyze_file(
         self,
         analyzer: SessionAnalyzer,
@@ -186,6 +210,7 @@ class TestSessionAnalyzerExtended:
         """Create analyzer instance."""
         return SessionAnalyzer()
 
+    @pytest.mark.filesystem
     def test_analyze_with_user_dict(self, tmp_path: Path) -> None:
         """Test analyzer with custom user dictionary."""
         dict_path = tmp_path / "user_dict.txt"
@@ -193,6 +218,7 @@ class TestSessionAnalyzerExtended:
         analyzer = SessionAnalyzer(user_dict_path=str(dict_path))
         assert analyzer is not None
 
+    @pytest.mark.filesystem
     def test_read_session_invalid_json(self, analyzer: SessionAnalyzer, tmp_path: Path) -> None:
         """Test reading session with invalid JSON lines."""
         session_file = tmp_path / "test.jsonl"
@@ -200,6 +226,29 @@ class TestSessionAnalyzerExtended:
         content = analyzer._read_session(session_file)
         assert len(content) == 2  # Invalid line should be skipped
 
+    @pytest.mark.filesystem
+    def test_read_session_skips_undecodable_lines(
+        self, analyzer: SessionAnalyzer, tmp_path: Path
+    ) -> None:
+        """Test lines with invalid UTF-8 are skipped like invalid JSON."""
+        session_file = tmp_path / "test.jsonl"
+        session_file.write_bytes(b'{"text": "valid"}\r\n{"text": "\xff"}\n\n{"text": "ok"}')
+        content = analyzer._read_session(session_file)
+        assert content == [{"text": "valid"}, {"text": "ok"}]
+
+    @pytest.mark.filesystem
+    def test_iter_session_texts(self, analyzer: SessionAnalyzer, tmp_path: Path) -> None:
+        """Test streaming text matches reading and extracting separately."""
+        session_file = tmp_path / "test.jsonl"
+        session_file.write_text(
+            '{"text": "first"}\ninvalid json\n{"message": {"content": "second"}}\n'
+        )
+
+        texts = list(analyzer._iter_session_texts(session_file))
+
+        assert texts == ["first", "second"]
+        assert " ".join(texts) == analyzer._extract_text(analyzer._read_session(session_file))
+
     def test_extract_text_with_message(self, analyzer: SessionAnalyzer) -> None:
         """Test extracting text from message format."""
         content = [{"message": "test message"}]
@@ -281,6 +330,7 @@ class TestSessionAnalyzerExtended:
         summary = analyzer._generate_summary(result)
         assert "遇到问题" in summary
 
+    @pytest.mark.filesystem
     def test_analyze_batch(self, analyzer: SessionAnalyzer, tmp_path: Path) -> None:
         """Test batch analysis."""
         # Create multiple session files
@@ -292,6 +342,151 @@ class TestSessionAnalyzerExtended:
         results = analyzer.analyze_batch(paths)
         assert len(results) == 3
 
+    @pytest.mark.filesystem
+    def test_analyze_batch_parallel_matches_serial(
+        self, analyzer: SessionAnalyzer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test worker processes return the serial results in input order."""
+        monkeypatch.setattr(core, "PARALLEL_MIN_FILES", 2)
+        monkeypatch.setattr(core, "PARALLEL_MIN_BYTES", 0)
+        texts = [
+            "实现登录功能。测试成功。",
+            "修复 parser.py 报错。失败了。",
+            "Let me add tests. Done.",
+        ]
+        paths = []
+        for i, text in enumerate(texts):
+            session_file = tmp_path / f"session_{i}.jsonl"
+            session_file.write_text(json.dumps({"text": text}, ensure_ascii=False))
+            paths.append(session_file)
+
+        assert analyzer.analyze_batch(paths, max_workers=2) == analyzer.analyze_batch(
+            paths, max_workers=1
+        )
+
+    @pytest.mark.filesystem
+    def test_analyze_batch_small_batch_stays_serial(
+        self, analyzer: SessionAnalyzer, tmp_path: Path
+    ) -> None:
+        """Test small batches are analyzed in-process without a worker pool."""
+        paths = []
+        for i in range(core.PARALLEL_MIN_FILES):
+            session_file = tmp_path / f"session_{i}.jsonl"
+            session_file.write_text(json.dumps({"text": f"实现功能{i}。成功完成。"}))
+            paths.append(session_file)
+
+        with patch.object(core, "ProcessPoolExecutor") as mock_pool:
+            results = analyzer.analyze_batch(paths, max_workers=4)
+
+        mock_pool.assert_not_called()
+        assert len(results) == len(paths)
+
+    @pytest.mark.filesystem
+    def test_analyze_uses_cache(self, tmp_path: Path) -> None:
+        """Test cached results are reused until the session file changes."""
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_text('{"text": "实现登录功能。测试成功。"}\n')
+        analyzer = SessionAnalyzer(cache_dir=tmp_path / "cache")
+
+        first = analyzer.analyze(session_file)
+        with patch.object(analyzer, "_analyze_uncached") as mock_analyze:
+            assert analyzer.analyze(session_file) == first
+        mock_analyze.assert_not_called()
+
+        session_file.write_text('{"text": "修复 parser.py 报错。构建失败了。"}\n')
+        assert analyzer.analyze(session_file).outcome == "failure"
+
+    @pytest.mark.filesystem
+    def test_analyze_batch_serves_cache_hits(self, tmp_path: Path) -> None:
+        """Test cached sessions are not sent to the workers again."""
+        paths = []
+        for i in range(3):
+            session_file = tmp_path / f"session_{i}.jsonl"
+            session_file.write_text(f'{{"text": "实现功能 {i}。测试成功。"}}\n')
+            paths.append(session_file)
+        analyzer = SessionAnalyzer(cache_dir=tmp_path / "cache")
+        first = analyzer.analyze_batch(paths[:2], max_workers=1)
+
+        with patch.object(analyzer, "_analyze_many", wraps=analyzer._analyze_many) as mock_many:
+            results = analyzer.analyze_batch(paths, max_workers=1)
+
+        mock_many.assert_called_once_with([paths[2]], 1)
+        assert results[:2] == first
+        assert len(results) == 3
+
+    @pytest.mark.filesystem
+    def test_clear_cache(self, tmp_path: Path) -> None:
+        """Test clearing the cache forces re-analysis."""
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_text('{"text": "实现登录功能。测试成功。"}\n')
+        analyzer = SessionAnalyzer(cache_dir=tmp_path / "cache")
+        analyzer.analyze(session_file)
+
+        analyzer.clear_cache()
+
+        assert list((tmp_path / "cache").glob("*.pkl")) == []
+
+    @pytest.mark.filesystem
+    def test_discard_cached(self, tmp_path: Path) -> None:
+        """Test discarding drops only the named sessions' cache entries."""
+        kept = tmp_path / "kept.jsonl"
+        gone = tmp_path / "gone.jsonl"
+        for session_file in (kept, gone):
+            session_file.write_text('{"text": "实现登录功能。测试成功。"}\n')
+        analyzer = SessionAnalyzer(cache_dir=tmp_path / "cache")
+        analyzer.analyze_batch([kept, gone])
+
+        analyzer.discard_cached([gone, tmp_path / "never-cached.jsonl"])
+
+        assert [p.name for p in (tmp_path / "cache").glob("*.pkl")] == [analyzer._cache_key(kept)]
+
+    @pytest.mark.filesystem
+    def test_analyze_extract_keywords_opt_in(self, tmp_path: Path) -> None:
+        """Test raw keywords are only segmented when requested."""
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_text('{"text": "实现用户认证功能。"}\n')
+
+        assert SessionAnalyzer().analyze(session_file).raw_keywords == []
+        keywords = SessionAnalyzer(extract_keywords=True).analyze(session_file).raw_keywords
+        assert "认证" in keywords or "用户" in keywords
+
+    def test_preload_is_idempotent(self, analyzer: SessionAnalyzer) -> None:
+        """Test preloading twice does not re-register dictionary terms."""
+        analyzer.preload()
+        tokenizer = analyzer._tokenizer
+        total = tokenizer.total
+        analyzer.preload()
+        SessionAnalyzer().preload()
+        assert SessionAnalyzer()._tokenizer is tokenizer
+        assert tokenizer.total == total
+
+    def test_default_tokenizer_built_once(self) -> None:
+        """Test every spelling of "no custom dictionary" shares one tokenizer."""
+        assert core._get_tokenizer() is core._get_tokenizer(None) is core._get_tokenizer("")
+
+    @pytest.mark.filesystem
+    def test_user_dict_is_isolated(self, tmp_path: Path) -> None:
+        """Test a custom dictionary does not leak into other analyzers."""
+        dict_path = tmp_path / "user_dict.txt"
+        dict_path.write_text("登录认证模块 100\n")
+        custom = SessionAnalyzer(user_dict_path=str(dict_path))
+
+        assert "登录认证模块" in custom._extract_keywords("重构登录认证模块")
+        assert "登录认证模块" not in SessionAnalyzer()._extract_keywords("重构登录认证模块")
+
+    @pytest.mark.parametrize(
+        "sentence",
+        [
+            "Let me fix the bug, then add tests.",
+            "update README.md; remove old_code and run pytest",
+            "Coverage is now 85% after 1.5 hours (deploy-ready)",
+        ],
+    )
+    def test_tokenize_ascii_matches_jieba(self, analyzer: SessionAnalyzer, sentence: str) -> None:
+        """Test the ASCII fast path finds the same words as jieba."""
+        words = [w for w in analyzer._tokenizer.lcut(sentence) if w[0].isalnum()]
+        assert _tokenize(sentence) == words
+
     def test_extract_goal_phrase_long_sentence(self, analyzer: SessionAnalyzer) -> None:
         """Test goal phrase extraction with long sentence."""
         long_sentence = "我想要实现一个非常非常非常非常非常非常非常非常非常非常非常长的目标功能"
@@ -103,6 +103,14 @@ class TestIntentAnalyzerMethods:
         result = analyzer._fallback_analysis("做用户认证", "error")
         assert result.time_hint == "all_time"
 
+    def test_fallback_strips_only_whole_english_words(self) -> None:
+        """Test filler words are not removed from inside longer words."""
+        analyzer = object.__new__(IntentAnalyzer)
+
+        result = analyzer._fallback_analysis("continue the token authentication work", "error")
+
+        assert result.concepts == ["continue", "token", "authentication"]
+
 
 class TestIntentAnalyzerInit:
     """Tests for IntentAnalyzer initialization."""
@@ -147,3 +155,69 @@ class TestIntentAnalyzerInit:
 
             assert "用户认证" in result.concepts
             assert result.time_hint == "recent"
+
+    def test_analyze_caches_repeated_queries(self) -> None:
+        """Test repeated queries reuse the first LLM response."""
+        with patch("analyzer.intent_analyzer.Anthropic") as mock_anthropic:
+            mock_response = MagicMock()
+            mock_block = MagicMock()
+            mock_block.text = '{"concepts": ["用户认证"], "time_hint": "all_time"}'
+            mock_response.content = [mock_block]
+
+            mock_client = MagicMock()
+            mock_client.messages.create.return_value = mock_response
+            mock_anthropic.return_value = mock_client
+
+            analyzer = IntentAnalyzer(api_key="test-key")
+            first = analyzer.analyze("用户认证")
+            first.concepts.append("mutated")
+            second = analyzer.analyze("用户认证")
+
+            assert mock_client.messages.create.call_count == 1
+            assert second.concepts == ["用户认证"]
+
+    def test_analyze_does_not_cache_fallback(self) -> None:
+        """Test failed requests are retried on the next call."""
+        with patch("analyzer.intent_analyzer.Anthropic") as mock_anthropic:
+            mock_client = MagicMock()
+            mock_client.messages.create.side_effect = Exception("API error")
+            mock_anthropic.return_value = mock_client
+
+            analyzer = IntentAnalyzer(api_key="test-key")
+            analyzer.analyze("用户认证")
+            analyzer.analyze("用户认证")
+
+            assert mock_client.messages.create.call_count == 2
+
+    def test_analyze_batch_concurrent(self) -> None:
+        """Test batch analysis fans out uncached queries and keeps order."""
+
+        async def create(**kwargs: object) -> MagicMock:
+            prompt = kwargs["messages"][0]["content"]  # type: ignore[index]
+            if "broken" in prompt:
+                raise RuntimeError("API error")
+            block = MagicMock()
+            block.text = '{"concepts": ["认证"], "time_hint": "recent"}'
+            response = MagicMock()
+            response.content = [block]
+            return response
+
+        with (
+            patch("analyzer.intent_analyzer.Anthropic"),
+            patch("analyzer.intent_analyzer.AsyncAnthropic") as mock_async_anthropic,
+        ):
+            mock_client = MagicMock()
+            mock_client.messages.create.side_effect = create
+            mock_async_anthropic.return_value.__aenter__.return_value = mock_client
+
+            analyzer = IntentAnalyzer(api_key="test-key")
+            results = analyzer.analyze_batch(["认证", "broken query", "认证"])
+
+            assert mock_client.messages.create.call_count == 2
+            assert results[0].concepts == ["认证"]
+            assert results[2].concepts == ["认证"]
+            assert "API error" in results[1].raw_response
+
+            # Successful analyses are cached for later calls
+            assert analyzer.analyze("认证").time_hint == "recent"
+            assert mock_client.messages.create.call_count == 2
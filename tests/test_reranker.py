@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -13,19 +13,20 @@ from analyzer.smart_search import SearchResult
 class TestRerankingWeights:
     """Tests for RerankingWeights dataclass."""
 
-    def test_default_weights(self) -> None:
-        """Test default weights sum to 1.0."""
-        weights = RerankingWeights()
-        assert weights.similarity == 0.5
-        assert weights.time_decay == 0.2
-        assert weights.project_match == 0.3
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, (0.5, 0.2, 0.3)),
+            ({"similarity": 0.6, "time_decay": 0.1, "project_match": 0.3}, (0.6, 0.1, 0.3)),
+        ],
+        ids=["default", "custom"],
+    )
+    def test_weights(self, kwargs: dict[str, float], expected: tuple[float, ...]) -> None:
+        """Test default and custom weights are stored and sum to 1.0."""
+        weights = RerankingWeights(**kwargs)
+        assert (weights.similarity, weights.time_decay, weights.project_match) == expected
         assert weights.similarity + weights.time_decay + weights.project_match == 1.0
 
-    def test_custom_weights(self) -> None:
-        """Test custom weights."""
-        weights = RerankingWeights(similarity=0.6, time_decay=0.1, project_match=0.3)
-        assert weights.similarity == 0.6
-
     def test_invalid_weights_raises(self) -> None:
         """Test invalid weights raise error."""
         with pytest.raises(ValueError, match="must sum to 1.0"):
@@ -35,15 +36,17 @@ class TestRerankingWeights:
 class TestResultReranker:
     """Tests for ResultReranker."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def reranker(self) -> ResultReranker:
-        """Create reranker instance."""
+        """Create a reranker shared by tests that do not reconfigure it."""
         return ResultReranker()
 
     @pytest.fixture
-    def sample_results(self) -> list[SearchResult]:
-        """Create sample search results."""
-        now = datetime.now()
+    def sample_results(self, now: datetime) -> list[SearchResult]:
+        """Create sample search results relative to the frozen clock.
+
+        Function-scoped, since rerank() overwrites each result's similarity.
+        """
         return [
             SearchResult(
                 session_id="recent-high",
@@ -119,71 +122,99 @@ class TestResultReranker:
         # Auth results should be in top positions
         assert any(idx < 2 for idx in auth_indices)
 
-    def test_normalize_similarity(self, reranker: ResultReranker) -> None:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (0.5, 0.5),
+            (50.0, 0.5),  # 50/100
+            (100.0, 1.0),
+            # Values between 1 and 10 are capped at 1.0 (max function)
+            (1.5, 1.0),
+            (5.0, 1.0),
+        ],
+    )
+    def test_normalize_similarity(
+        self, reranker: ResultReranker, value: float, expected: float
+    ) -> None:
         """Test similarity normalization."""
-        assert reranker._normalize_similarity(0.5) == 0.5
-        assert reranker._normalize_similarity(50.0) == 0.5  # 50/100
-        assert reranker._normalize_similarity(100.0) == 1.0
-        # Values between 1 and 10 are capped at 1.0 (max function)
-        assert reranker._normalize_similarity(1.5) == 1.0
-        assert reranker._normalize_similarity(5.0) == 1.0
-
-    def test_calculate_time_decay_recent(self, reranker: ResultReranker) -> None:
-        """Test time decay for recent timestamp."""
-        recent = datetime.now() - timedelta(hours=1)
-        score = reranker._calculate_time_decay(recent)
-        assert score > 0.9  # Very recent should have high score
-
-    def test_calculate_time_decay_old(self, reranker: ResultReranker) -> None:
-        """Test time decay for old timestamp."""
-        old = datetime.now() - timedelta(days=30)
-        score = reranker._calculate_time_decay(old)
-        assert score < 0.5  # Old should have lower score
-
-    def test_calculate_time_decay_none(self, reranker: ResultReranker) -> None:
-        """Test time decay for None timestamp."""
-        score = reranker._calculate_time_decay(None)
-        assert score == 0.5  # Neutral score
-
-    def test_calculate_time_decay_with_boost(self, reranker: ResultReranker) -> None:
+        assert reranker._normalize_similarity(value) == expected
+
+    @pytest.mark.parametrize(
+        ("age", "expected"),
+        [
+            (timedelta(hours=1), 0.5 ** (1 / 168)),  # Very recent scores high
+            (timedelta(days=7), 0.5),  # One half-life
+            (timedelta(days=30), 0.5 ** (30 / 7)),  # Old scores low
+            (None, 0.5),  # Neutral score without a timestamp
+        ],
+        ids=["recent", "half-life", "old", "none"],
+    )
+    def test_calculate_time_decay(
+        self,
+        reranker: ResultReranker,
+        now: datetime,
+        age: timedelta | None,
+        expected: float,
+    ) -> None:
+        """Test time decay against the frozen clock."""
+        timestamp = now - age if age is not None else None
+        assert reranker._calculate_time_decay(timestamp) == pytest.approx(expected)
+
+    def test_calculate_time_decay_with_boost(self, reranker: ResultReranker, now: datetime) -> None:
         """Test time decay with boost factor."""
-        recent = datetime.now() - timedelta(hours=1)
+        recent = now - timedelta(hours=1)
         normal_score = reranker._calculate_time_decay(recent, boost=1.0)
         boosted_score = reranker._calculate_time_decay(recent, boost=1.5)
 
         assert boosted_score > normal_score
 
-    def test_calculate_project_match_exact(self, reranker: ResultReranker) -> None:
-        """Test project match for exact match."""
-        result = SearchResult(
-            session_id="test",
-            project_path="/project/auth-service",
-            summary="Test",
-        )
-        score = reranker._calculate_project_match(result, project_hint="auth-service")
-        assert score > 0.7  # Should get high match score
-
-    def test_calculate_project_match_no_match(self, reranker: ResultReranker) -> None:
-        """Test project match for no match."""
-        result = SearchResult(
-            session_id="test",
-            project_path="/project/xyz",
-            summary="Test",
-        )
-        score = reranker._calculate_project_match(result, project_hint="auth")
-        assert score == 0.5  # Neutral score
-
-    def test_set_current_project(self, reranker: ResultReranker) -> None:
+    def test_calculate_time_decay_aware_timestamp(
+        self, reranker: ResultReranker, now: datetime
+    ) -> None:
+        """Test timezone-aware timestamps decay against an aware clock."""
+        recent = now.replace(tzinfo=timezone.utc) - timedelta(hours=1)
+        assert reranker._calculate_time_decay(recent) > 0.9
+
+    @pytest.mark.parametrize(
+        ("project_path", "project_hint", "expected"),
+        [
+            ("/project/auth-service", "auth-service", 1.0),  # Exact match
+            ("/project/xyz", "auth", 0.5),  # No match scores neutral
+        ],
+        ids=["exact", "no-match"],
+    )
+    def test_calculate_project_match(
+        self,
+        reranker: ResultReranker,
+        project_path: str,
+        project_hint: str,
+        expected: float,
+    ) -> None:
+        """Test project match scores for matching and unrelated hints."""
+        result = SearchResult(session_id="test", project_path=project_path, summary="Test")
+        assert reranker._calculate_project_match(result, project_hint=project_hint) == expected
+
+    def test_set_current_project(self) -> None:
         """Test setting current project."""
+        reranker = ResultReranker()
         reranker.set_current_project("/new/project")
         assert reranker.current_project == "/new/project"
 
-    def test_custom_half_life(self, sample_results: list[SearchResult]) -> None:
+    def test_set_current_project_affects_match(self) -> None:
+        """Test changing the current project is reflected in project scores."""
+        reranker = ResultReranker()
+        result = SearchResult(session_id="test", project_path="/Work/Auth", summary="Test")
+        assert reranker._calculate_project_match(result, project_hint=None) == 0.5
+
+        reranker.set_current_project("/work/auth")
+        assert reranker._calculate_project_match(result, project_hint=None) == 0.9
+
+    def test_custom_half_life(self, now: datetime) -> None:
         """Test custom half-life affects time decay."""
         short_half_life = ResultReranker(half_life_days=1.0)
         long_half_life = ResultReranker(half_life_days=30.0)
 
-        old_time = datetime.now() - timedelta(days=7)
+        old_time = now - timedelta(days=7)
 
         short_score = short_half_life._calculate_time_decay(old_time)
         long_score = long_half_life._calculate_time_decay(old_time)
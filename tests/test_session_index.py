@@ -0,0 +1,95 @@
+"""Unit tests for session index module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from analyzer.session_index import SessionIndex
+
+
+@pytest.mark.filesystem
+class TestSessionIndex:
+    """Tests for SessionIndex."""
+
+    def test_get_validates_mtime_and_size(self, tmp_path: Path) -> None:
+        """Test entries are only returned while the file is unchanged."""
+        session_file = tmp_path / "s1.jsonl"
+        session_file.write_text("one")
+        index = SessionIndex(tmp_path / "index.pkl")
+        index.put(session_file, session_file.stat(), frozenset({"one"}), "one")
+
+        assert index.get(session_file, session_file.stat()) is not None
+
+        session_file.write_text("longer")
+
+        assert index.get(session_file, session_file.stat()) is None
+
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        """Test saved entries are restored by a fresh index."""
+        session_file = tmp_path / "s1.jsonl"
+        session_file.write_text("one")
+        index_path = tmp_path / "idx" / "index.pkl"
+        index = SessionIndex(index_path)
+        index.put(session_file, session_file.stat(), frozenset({"one"}), "preview")
+        index.save()
+
+        loaded = SessionIndex(index_path)
+        loaded.load()
+        entry = loaded.get(session_file, session_file.stat())
+
+        assert entry is not None
+        assert entry.words == frozenset({"one"})
+        assert entry.summary == "preview"
+
+    def test_load_ignores_corrupt_file(self, tmp_path: Path) -> None:
+        """Test an unreadable index file starts an empty index."""
+        index_path = tmp_path / "index.pkl"
+        index_path.write_bytes(b"not a pickle")
+        index = SessionIndex(index_path)
+        index.load()
+
+        assert index.entries == {}
+
+    def test_prune_drops_missing_sessions(self, tmp_path: Path) -> None:
+        """Test pruning removes entries for deleted sessions."""
+        session_file = tmp_path / "s1.jsonl"
+        session_file.write_text("one")
+        index = SessionIndex(tmp_path / "index.pkl")
+        index.put(session_file, session_file.stat(), frozenset(), "")
+        removed = index.prune(set())
+
+        assert index.entries == {}
+        assert removed == {str(session_file)}
+
+    def test_candidates_follow_updates(self, tmp_path: Path) -> None:
+        """Test posting lists track re-indexed and pruned sessions."""
+        s1 = tmp_path / "s1.jsonl"
+        s2 = tmp_path / "s2.jsonl"
+        s1.write_text("one")
+        s2.write_text("two")
+        index = SessionIndex(tmp_path / "index.pkl")
+        index.put(s1, s1.stat(), frozenset({"auth", "jwt"}), "")
+        index.put(s2, s2.stat(), frozenset({"database"}), "")
+
+        assert index.match_counts({"auth", "jwt", "database"}) == {str(s1): 2, str(s2): 1}
+
+        index.put(s1, s1.stat(), frozenset({"cache"}), "")
+        index.prune({str(s1)})
+
+        assert index.match_counts({"auth", "database"}) == {}
+        assert index.match_counts({"cache", "missing"}) == {str(s1): 1}
+
+    def test_load_rebuilds_postings(self, tmp_path: Path) -> None:
+        """Test postings are restored from saved entries."""
+        s1 = tmp_path / "s1.jsonl"
+        s1.write_text("one")
+        index = SessionIndex(tmp_path / "index.pkl")
+        index.put(s1, s1.stat(), frozenset({"auth"}), "")
+        index.save()
+
+        loaded = SessionIndex(tmp_path / "index.pkl")
+        loaded.load()
+
+        assert loaded.match_counts({"auth"}) == {str(s1): 1}
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+import os
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -11,14 +14,34 @@ import pytest
 from analyzer.intent_analyzer import IntentAnalysisResult
 from analyzer.reranker import ResultReranker
 from analyzer.smart_search import (
+    WORD_PATTERN,
     LocalSessionSearcher,
     SearchResult,
     SmartSearch,
     SmartSearchResult,
+    _find_words,
     quick_search,
 )
 
 
+def _ten_results() -> list[SearchResult]:
+    """Build ten equally similar results, s-0 through s-9."""
+    return [
+        SearchResult(session_id=f"s-{i}", project_path="/p", summary=f"R{i}", similarity=0.5)
+        for i in range(10)
+    ]
+
+
+def _one_result() -> list[SearchResult]:
+    """Build the single result most search tests feed to the mock searcher."""
+    return [SearchResult(session_id="test-1", project_path="/p", summary="Test", similarity=0.8)]
+
+
+# Shared read-only results; tests that rerank must use _ten_results(), since
+# reranking overwrites each result's similarity
+TEN_RESULTS = tuple(_ten_results())
+
+
 class TestSearchResult:
     """Tests for SearchResult dataclass."""
 
@@ -59,6 +82,30 @@ class TestSearchResult:
         assert d["actions"] == ["action1"]
         assert d["outcome"] == "success"
 
+    def test_uses_slots(self) -> None:
+        """Test results carry no per-instance __dict__."""
+        result = SearchResult(session_id="s-1", project_path="/p", summary="Test")
+
+        assert not hasattr(result, "__dict__")
+
+
+class TestFindWords:
+    """Tests for word tokenization."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "fix auth_token bug in login.py (v2.0)",
+            "tab\tand\x00control\x1fchars",
+            "héllo wörld",
+            "继续做用户认证 JWT",
+        ],
+    )
+    def test_matches_word_pattern(self, text: str) -> None:
+        """Test the fast path yields the same tokens as the regex."""
+        assert _find_words(text) == WORD_PATTERN.findall(text)
+
 
 class TestSmartSearchResult:
     """Tests for SmartSearchResult."""
@@ -76,15 +123,10 @@ class TestSmartSearchResult:
 
     def test_get_top_sessions(self) -> None:
         """Test getting top sessions."""
-        results = [
-            SearchResult(session_id=f"s-{i}", project_path="/p", summary=f"Result {i}")
-            for i in range(10)
-        ]
-
         search_result = SmartSearchResult(
             query="test",
             intent=IntentAnalysisResult(),
-            results=results,
+            results=list(TEN_RESULTS),
         )
 
         top_5 = search_result.get_top_sessions(5)
@@ -123,75 +165,332 @@ class TestSmartSearchResult:
         assert d["total_found"] == 1
 
 
-class TestLocalSessionSearcher:
-    """Tests for LocalSessionSearcher."""
+@pytest.fixture(scope="session")
+def session_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build one read-only Claude dir with two sessions in one project."""
+    base = tmp_path_factory.mktemp("claude")
+    project_dir = base / "projects" / "my-project"
+    project_dir.mkdir(parents=True)
+    for name in ("session1.jsonl", "session2.jsonl"):
+        (project_dir / name).write_text('{"message": {"content": "Hello world"}}\n')
+    return base
+
 
-    def test_extract_session_id(self, tmp_path: Path) -> None:
+@pytest.fixture(scope="session")
+def empty_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build one read-only Claude dir with an empty projects directory."""
+    base = tmp_path_factory.mktemp("claude-empty")
+    (base / "projects").mkdir()
+    return base
+
+
+class TestLocalSessionSearcherPaths:
+    """Tests for LocalSessionSearcher path parsing, which never touches disk."""
+
+    def test_extract_session_id(self) -> None:
         """Test extracting session ID from path."""
-        searcher = LocalSessionSearcher(claude_dir=tmp_path)
-        session_path = tmp_path / "project" / "abc123.jsonl"
+        claude_dir = Path("/tmp/claude")
+        searcher = LocalSessionSearcher(claude_dir=claude_dir)
+        session_path = claude_dir / "project" / "abc123.jsonl"
         assert searcher.extract_session_id(session_path) == "abc123"
 
-    def test_extract_project_name(self, tmp_path: Path) -> None:
+    def test_extract_project_name(self) -> None:
         """Test extracting project name from path."""
-        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        claude_dir = Path("/tmp/claude")
+        searcher = LocalSessionSearcher(claude_dir=claude_dir)
 
         # Test with encoded path
-        session_path = tmp_path / "-Users-foo-projects-myapp" / "session.jsonl"
+        session_path = claude_dir / "-Users-foo-projects-myapp" / "session.jsonl"
         assert searcher.extract_project_name(session_path) == "/Users/foo/projects/myapp"
 
-    def test_find_all_sessions_empty(self, tmp_path: Path) -> None:
-        """Test finding sessions in empty directory."""
-        projects_dir = tmp_path / "projects"
-        projects_dir.mkdir()
 
-        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+@pytest.mark.filesystem
+class TestLocalSessionSearcher:
+    """Tests for LocalSessionSearcher."""
+
+    def test_find_all_sessions_empty(self, empty_tree: Path) -> None:
+        """Test finding sessions in empty directory."""
+        searcher = LocalSessionSearcher(claude_dir=empty_tree)
         sessions = searcher.find_all_sessions()
 
         assert sessions == []
 
-    def test_find_all_sessions(self, tmp_path: Path) -> None:
+    def test_find_all_sessions(self, session_tree: Path) -> None:
         """Test finding sessions."""
-        projects_dir = tmp_path / "projects"
-        project_dir = projects_dir / "my-project"
+        searcher = LocalSessionSearcher(claude_dir=session_tree)
+        sessions = searcher.find_all_sessions()
+
+        assert len(sessions) == 2
+
+    def test_read_session_content(self, session_tree: Path) -> None:
+        """Test reading session content."""
+        session_file = session_tree / "projects" / "my-project" / "session1.jsonl"
+
+        searcher = LocalSessionSearcher(claude_dir=session_tree)
+        content = searcher.read_session_content(session_file)
+
+        assert "Hello world" in content
+
+    def test_read_session_content_skips_bad_lines(self, tmp_path: Path) -> None:
+        """Test invalid JSON and invalid UTF-8 lines are skipped."""
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_bytes(
+            b'{"message": {"content": "first"}}\r\nnot json\n'
+            b'{"message": {"content": "\xff"}}\n'
+            b'{"message": {"content": [{"type": "text", "text": "second"}]}}'
+        )
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+
+        assert searcher.read_session_content(session_file) == "first second"
+
+    def test_read_session_content_empty_file(self, tmp_path: Path) -> None:
+        """Test empty session files read as empty content."""
+        session_file = tmp_path / "session.jsonl"
+        session_file.touch()
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+
+        assert searcher.read_session_content(session_file) == ""
+
+    def test_search_filters_by_time_window(self, tmp_path: Path) -> None:
+        """Test since/until restrict results to the modification window."""
+        project_dir = tmp_path / "projects" / "my-project"
         project_dir.mkdir(parents=True)
+        base = datetime(2026, 2, 1, 12, 0)
+        for day in range(5):
+            session_file = project_dir / f"day{day}.jsonl"
+            session_file.write_text('{"message": {"content": "auth work"}}\n')
+            mtime = (base + timedelta(days=day)).timestamp()
+            os.utime(session_file, (mtime, mtime))
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        results = searcher.search(
+            "auth",
+            since=base + timedelta(days=1),
+            until=base + timedelta(days=3),
+        )
+
+        assert sorted(r.session_id for r in results) == ["day1", "day2", "day3"]
 
-        # Create some session files
-        (project_dir / "session1.jsonl").touch()
-        (project_dir / "session2.jsonl").touch()
+    def test_search_list_all_returns_most_recent(self, tmp_path: Path) -> None:
+        """Test listing without a query returns the newest sessions first."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        base = datetime(2026, 2, 1, 12, 0)
+        for day in range(5):
+            session_file = project_dir / f"day{day}.jsonl"
+            session_file.write_text('{"message": {"content": "work"}}\n')
+            mtime = (base + timedelta(days=day)).timestamp()
+            os.utime(session_file, (mtime, mtime))
 
         searcher = LocalSessionSearcher(claude_dir=tmp_path)
-        sessions = searcher.find_all_sessions()
+        results = searcher.search("", limit=2)
 
-        assert len(sessions) == 2
+        assert [r.session_id for r in results] == ["day4", "day3"]
 
-    def test_read_session_content(self, tmp_path: Path) -> None:
-        """Test reading session content."""
-        projects_dir = tmp_path / "projects"
-        project_dir = projects_dir / "my-project"
+    def test_search_scores_by_matched_words(self, tmp_path: Path) -> None:
+        """Test similarity is the matched fraction, boosted for multiple matches."""
+        project_dir = tmp_path / "projects" / "my-project"
         project_dir.mkdir(parents=True)
+        (project_dir / "one.jsonl").write_text('{"message": {"content": "auth"}}\n')
+        (project_dir / "two.jsonl").write_text('{"message": {"content": "auth jwt"}}\n')
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        results = searcher.search("auth jwt token")
 
-        session_file = project_dir / "session.jsonl"
-        session_file.write_text('{"message": {"content": "Hello world"}}\n')
+        assert [r.session_id for r in results] == ["two", "one"]
+        assert results[0].similarity == pytest.approx(1.0)
+        assert results[1].similarity == pytest.approx(1 / 3)
+
+    def test_search_indexes_many_sessions_concurrently(self, tmp_path: Path) -> None:
+        """Test a concurrent index refresh finds every matching session."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        for i in range(20):
+            content = "auth work" if i % 2 else "other work"
+            (project_dir / f"s{i:02d}.jsonl").write_text(
+                f'{{"message": {{"content": "{content}"}}}}\n'
+            )
 
         searcher = LocalSessionSearcher(claude_dir=tmp_path)
-        content = searcher.read_session_content(session_file)
+        results = searcher.search("auth", limit=20)
 
-        assert "Hello world" in content
+        assert sorted(r.session_id for r in results) == [f"s{i:02d}" for i in range(1, 20, 2)]
+        assert len(searcher.index.entries) == 20
 
+    def test_search_skips_unindexable_session(self, tmp_path: Path) -> None:
+        """Test a session that fails to index is skipped, not fatal to the search."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        (project_dir / "good.jsonl").write_text('{"message": {"content": "auth work"}}\n')
+        bad_line = '{"message": {"content": [{"type": "text", "text": null}]}}\n'
+        (project_dir / "bad.jsonl").write_text(bad_line)
 
-class TestSmartSearch:
-    """Tests for SmartSearch class."""
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        assert [r.session_id for r in searcher.search(["auth"])] == ["good"]
 
-    @pytest.fixture
-    def mock_searcher(self) -> SmartSearch:
-        """Create SmartSearch with mock components."""
+        # A lone new session is indexed on the calling thread
+        (project_dir / "bad2.jsonl").write_text(bad_line)
+        assert [r.session_id for r in searcher.search(["auth"])] == ["good"]
+
+    def test_search_concurrent_refresh_skips_unreadable_session(self, tmp_path: Path) -> None:
+        """Test one session failing to index does not lose the others read with it."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        for i in range(8):
+            (project_dir / f"s{i}.jsonl").write_text('{"message": {"content": "auth work"}}\n')
+        (project_dir / "bad.jsonl").write_text(
+            '{"message": {"content": [{"type": "text", "text": null}]}}\n'
+        )
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        results = searcher.search("auth", limit=20)
+
+        assert sorted(r.session_id for r in results) == [f"s{i}" for i in range(8)]
+        assert str(project_dir / "bad.jsonl") not in searcher.index.entries
+
+    def test_search_reuses_cached_analysis(self, tmp_path: Path) -> None:
+        """Test session analyses persist across searchers."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        (project_dir / "s1.jsonl").write_text('{"message": {"content": "auth work"}}\n')
+
+        LocalSessionSearcher(claude_dir=tmp_path).search("auth", deep=True)
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        with patch.object(searcher.analyzer, "_analyze_uncached") as mock_analyze:
+            results = searcher.search("auth", deep=True)
+
+        mock_analyze.assert_not_called()
+        assert [r.session_id for r in results] == ["s1"]
+
+    def test_search_drops_cached_analysis_of_deleted_session(self, tmp_path: Path) -> None:
+        """Test analyses of deleted sessions are removed from the cache."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        for name in ("s1", "s2"):
+            (project_dir / f"{name}.jsonl").write_text('{"message": {"content": "auth work"}}\n')
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        searcher.search("auth", deep=True)
+        cache_dir = searcher.analyzer.cache_dir
+        assert cache_dir is not None
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+        (project_dir / "s2.jsonl").unlink()
+        searcher.search("auth", deep=True)
+
+        assert [p.name for p in cache_dir.glob("*.pkl")] == [
+            searcher.analyzer._cache_key(project_dir / "s1.jsonl")
+        ]
+
+    def test_search_analyzes_only_returned_sessions(self, tmp_path: Path) -> None:
+        """Test sessions ranked below the limit are never analyzed."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        for i in range(6):
+            (project_dir / f"s{i}.jsonl").write_text('{"message": {"content": "auth work"}}\n')
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        with patch.object(searcher.analyzer, "analyze", wraps=searcher.analyzer.analyze) as mock:
+            results = searcher.search("auth", limit=2, deep=True)
+
+        assert len(results) == 2
+        assert mock.call_count == 2
+
+    def test_search_skips_analysis_unless_deep(self, tmp_path: Path) -> None:
+        """Test shallow searches never run the session analyzer."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        (project_dir / "s1.jsonl").write_text('{"message": {"content": "auth work"}}\n')
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        with patch.object(searcher.analyzer, "analyze") as mock_analyze:
+            results = searcher.search("auth")
+
+        mock_analyze.assert_not_called()
+        assert results[0].summary == "auth work"
+
+    def test_search_reuses_persisted_index(self, tmp_path: Path) -> None:
+        """Test an unchanged corpus is searched without re-reading sessions."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        (project_dir / "s1.jsonl").write_text('{"message": {"content": "auth work"}}\n')
+
+        LocalSessionSearcher(claude_dir=tmp_path).search("auth")
+        assert (tmp_path / ".session-search-index" / "index.pkl").exists()
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        with patch.object(searcher, "iter_session_texts") as mock_read:
+            results = searcher.search("auth")
+
+        mock_read.assert_not_called()
+        assert [r.session_id for r in results] == ["s1"]
+
+    def test_search_rebuilds_index_on_change(self, tmp_path: Path) -> None:
+        """Test modified sessions are re-indexed."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        session_file = project_dir / "s1.jsonl"
+        session_file.write_text('{"message": {"content": "auth work"}}\n')
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        assert searcher.search("database") == []
+
+        session_file.write_text('{"message": {"content": "database migration work"}}\n')
+
+        assert [r.session_id for r in searcher.search("database")] == ["s1"]
+
+    def test_search_rereads_only_changed_sessions(self, tmp_path: Path) -> None:
+        """Test unchanged sessions are served from the index."""
+        project_dir = tmp_path / "projects" / "my-project"
+        project_dir.mkdir(parents=True)
+        for name in ("s1", "s2", "s3"):
+            (project_dir / f"{name}.jsonl").write_text('{"message": {"content": "auth work"}}\n')
+
+        LocalSessionSearcher(claude_dir=tmp_path).search("auth")
+        (project_dir / "s2.jsonl").write_text('{"message": {"content": "auth and database"}}\n')
+
+        searcher = LocalSessionSearcher(claude_dir=tmp_path)
+        with patch.object(
+            searcher, "iter_session_texts", wraps=searcher.iter_session_texts
+        ) as mock_read:
+            results = searcher.search("database")
+
+        mock_read.assert_called_once_with(project_dir / "s2.jsonl")
+        assert [r.session_id for r in results] == ["s2"]
+
+
+@pytest.fixture
+def make_search() -> Callable[..., SmartSearch]:
+    """Return a factory for SmartSearch instances wired to mock components."""
+
+    def _make(
+        results: list[SearchResult] | None = None,
+        side_effect: Exception | None = None,
+        current_project: str | None = None,
+    ) -> SmartSearch:
         searcher = object.__new__(SmartSearch)
         searcher.intent_analyzer = None  # Will use fallback
         searcher.local_searcher = MagicMock()
-        searcher.reranker = ResultReranker()
+        if results is not None:
+            searcher.local_searcher.search.return_value = results
+        if side_effect is not None:
+            searcher.local_searcher.search.side_effect = side_effect
+        searcher.reranker = ResultReranker(current_project=current_project)
         return searcher
 
+    return _make
+
+
+class TestSmartSearch:
+    """Tests for SmartSearch class."""
+
+    @pytest.fixture
+    def mock_searcher(self, make_search: Callable[..., SmartSearch]) -> SmartSearch:
+        """Create SmartSearch with mock components."""
+        return make_search()
+
     def test_fallback_intent_analysis(self, mock_searcher: SmartSearch) -> None:
         """Test fallback intent analysis."""
         result = mock_searcher._fallback_intent_analysis("继续做用户认证功能")
@@ -199,6 +498,12 @@ class TestSmartSearch:
         assert len(result.concepts) > 0
         assert result.time_hint in ["recent", "all_time"]
 
+    def test_fallback_dedupes_concepts(self, mock_searcher: SmartSearch) -> None:
+        """Test repeated query words yield one concept, in query order."""
+        result = mock_searcher._fallback_intent_analysis("auth bug and auth fix")
+
+        assert result.concepts == ["auth", "bug", "fix"]
+
     def test_fallback_detects_recent(self, mock_searcher: SmartSearch) -> None:
         """Test fallback detects recent time hint."""
         result = mock_searcher._fallback_intent_analysis("最近做认证")
@@ -206,15 +511,7 @@ class TestSmartSearch:
 
     def test_search_returns_result(self, mock_searcher: SmartSearch) -> None:
         """Test search returns SmartSearchResult."""
-        mock_results = [
-            SearchResult(
-                session_id="test-1",
-                project_path="/p",
-                summary="Test result",
-                similarity=0.8,
-            ),
-        ]
-        mock_searcher.local_searcher.search.return_value = mock_results
+        mock_searcher.local_searcher.search.return_value = _one_result()
 
         result = mock_searcher.search("test query")
 
@@ -223,24 +520,47 @@ class TestSmartSearch:
 
     def test_search_respects_limit(self, mock_searcher: SmartSearch) -> None:
         """Test search respects limit parameter."""
-        mock_results = [
-            SearchResult(session_id=f"s-{i}", project_path="/p", summary=f"R{i}", similarity=0.5)
-            for i in range(10)
-        ]
-        mock_searcher.local_searcher.search.return_value = mock_results
+        mock_searcher.local_searcher.search.return_value = _ten_results()
 
         result = mock_searcher.search("test", limit=3)
 
         assert len(result.results) <= 3
 
+    def test_search_analyzes_only_final_results(self, mock_searcher: SmartSearch) -> None:
+        """Test only reranked results within the limit are analyzed."""
+        mock_searcher.local_searcher.search.return_value = _ten_results()
+
+        mock_searcher.search("test", limit=3)
+
+        assert mock_searcher.local_searcher.search.call_args.kwargs["deep"] is False
+        assert mock_searcher.local_searcher.analyze_result.call_count == 3
+
     def test_set_current_project(self, mock_searcher: SmartSearch) -> None:
         """Test setting current project."""
         mock_searcher.set_current_project("/my/project")
         assert mock_searcher.reranker.current_project == "/my/project"
 
-    def test_search_and_format_text(self, mock_searcher: SmartSearch) -> None:
-        """Test search_and_format with text format."""
-        mock_results = [
+    def test_search_result_to_dict(self, mock_searcher: SmartSearch) -> None:
+        """Test search results convert to the dict serialized as JSON."""
+        mock_searcher.local_searcher.search.return_value = _one_result()
+
+        data = mock_searcher.search("test").to_dict()
+
+        assert "query" in data
+        assert "results" in data
+
+    @pytest.mark.parametrize(
+        ("format_type", "expected"),
+        [
+            ("text", ("test", "Test result summary")),
+            ("markdown", ("##", "Test result summary")),  # Markdown headers
+        ],
+    )
+    def test_search_and_format(
+        self, mock_searcher: SmartSearch, format_type: str, expected: tuple[str, ...]
+    ) -> None:
+        """Test search_and_format renders results in each output format."""
+        mock_searcher.local_searcher.search.return_value = [
             SearchResult(
                 session_id="test-session-id-123",
                 project_path="/project/test",
@@ -248,50 +568,30 @@ class TestSmartSearch:
                 similarity=0.85,
             ),
         ]
-        mock_searcher.local_searcher.search.return_value = mock_results
 
-        output = mock_searcher.search_and_format("test", format_type="text")
+        output = mock_searcher.search_and_format("test", format_type=format_type)
 
-        assert "test" in output
-        assert "Test result summary" in output
+        for substring in expected:
+            assert substring in output
 
     def test_search_and_format_json(self, mock_searcher: SmartSearch) -> None:
-        """Test search_and_format with JSON format."""
-        import json
-
-        mock_results = [
-            SearchResult(
-                session_id="test-1",
-                project_path="/p",
-                summary="Test",
-                similarity=0.8,
-            ),
-        ]
-        mock_searcher.local_searcher.search.return_value = mock_results
+        """Test search_and_format with JSON format emits one JSON object."""
+        mock_searcher.local_searcher.search.return_value = _one_result()
 
         output = mock_searcher.search_and_format("test", format_type="json")
 
-        # Should be valid JSON
-        data = json.loads(output)
-        assert "query" in data
-        assert "results" in data
+        assert output.startswith("{")
+        assert output.rstrip().endswith("}")
 
-    def test_search_and_format_markdown(self, mock_searcher: SmartSearch) -> None:
-        """Test search_and_format with markdown format."""
-        mock_results = [
-            SearchResult(
-                session_id="test-1",
-                project_path="/p",
-                summary="Test result",
-                similarity=0.9,
-            ),
-        ]
-        mock_searcher.local_searcher.search.return_value = mock_results
+    @pytest.mark.slow
+    def test_search_and_format_json_is_valid(self, mock_searcher: SmartSearch) -> None:
+        """Test search_and_format JSON output parses back to the result dict."""
+        mock_searcher.local_searcher.search.return_value = _one_result()
 
-        output = mock_searcher.search_and_format("test", format_type="markdown")
+        data = json.loads(mock_searcher.search_and_format("test", format_type="json"))
 
-        assert "##" in output  # Markdown headers
-        assert "Test result" in output
+        assert data["query"] == "test"
+        assert [r["session_id"] for r in data["results"]] == ["test-1"]
 
     def test_search_no_results(self, mock_searcher: SmartSearch) -> None:
         """Test search with no results."""
@@ -314,72 +614,54 @@ class TestSmartSearch:
 class TestSmartSearchConvenience:
     """Tests for convenience function."""
 
-    def test_quick_search_function(self) -> None:
-        """Test quick_search convenience function."""
-        mock_results = [
-            SearchResult(
-                session_id="test-1",
-                project_path="/p",
-                summary="Test",
-                similarity=0.8,
-            ),
-        ]
-
-        # Create a proper mock searcher
-        mock_searcher = object.__new__(SmartSearch)
-        mock_searcher.intent_analyzer = None
-        mock_searcher.local_searcher = MagicMock()
-        mock_searcher.local_searcher.search.return_value = mock_results
-        mock_searcher.reranker = ResultReranker()
-
-        with patch("analyzer.smart_search.SmartSearch", return_value=mock_searcher):
-            results = quick_search("test query")
-            assert isinstance(results, list)
+    def test_quick_search_function(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test quick_search runs a deep local search and returns its results."""
+        results = _one_result()
+        searcher_cls = MagicMock()
+        searcher_cls.return_value.search.return_value = results
+        # Never touch the developer's real ~/.claude
+        monkeypatch.setattr("analyzer.smart_search.LocalSessionSearcher", searcher_cls)
+
+        assert quick_search("test query", limit=3) is results
+        searcher_cls.return_value.search.assert_called_once_with(
+            "test query", limit=3, since=None, until=None, deep=True
+        )
 
 
 class TestSmartSearchErrorHandling:
     """Tests for error handling in SmartSearch."""
 
-    def test_search_with_searcher_error(self) -> None:
+    def test_search_with_searcher_error(self, make_search: Callable[..., SmartSearch]) -> None:
         """Test search handles searcher errors gracefully."""
-        # Create searcher with mock that raises error
-        searcher = object.__new__(SmartSearch)
-        searcher.intent_analyzer = None
-        searcher.reranker = ResultReranker()
-
-        # Create a mock searcher that raises an error
-        mock_local_searcher = MagicMock()
-        mock_local_searcher.search.side_effect = Exception("Search error")
-        searcher.local_searcher = mock_local_searcher
+        searcher = make_search(side_effect=Exception("Search error"))
 
         # Search should not crash
         result = searcher.search("test query")
         assert result.total_found == 0
 
-    def test_search_with_project_hint(self) -> None:
+    def test_search_with_project_hint(
+        self, make_search: Callable[..., SmartSearch], now: datetime
+    ) -> None:
         """Test search with project hint in results."""
         mock_results = [
             SearchResult(
                 session_id="test-1",
                 project_path="/project/auth-service",
                 summary="Auth implementation",
-                timestamp=datetime.now(),
+                timestamp=now,
                 similarity=0.9,
             ),
         ]
 
-        searcher = object.__new__(SmartSearch)
-        searcher.intent_analyzer = None
-        searcher.local_searcher = MagicMock()
-        searcher.local_searcher.search.return_value = mock_results
-        searcher.reranker = ResultReranker(current_project="/project/auth")
+        searcher = make_search(mock_results, current_project="/project/auth")
 
         result = searcher.search("auth")
         assert len(result.results) > 0
 
-    def test_search_with_recent_time_hint(self) -> None:
+    def test_search_with_recent_time_hint(
+        self, make_search: Callable[..., SmartSearch], now: datetime
+    ) -> None:
         """Test search with recent time hint."""
-        now = datetime.now()
         mock_results = [
             SearchResult(
                 session_id="recent",
@@ -397,11 +679,7 @@ class TestSmartSearchErrorHandling:
             ),
         ]
 
-        searcher = object.__new__(SmartSearch)
-        searcher.intent_analyzer = None
-        searcher.local_searcher = MagicMock()
-        searcher.local_searcher.search.return_value = mock_results
-        searcher.reranker = ResultReranker()
+        searcher = make_search(mock_results)
 
         # Search with "recent" keyword
         result = searcher.search("最近做认证")
@@ -409,7 +687,9 @@ class TestSmartSearchErrorHandling:
         # Recent should be ranked higher
         assert result.results[0].session_id == "recent"
 
-    def test_search_and_format_with_project_hint(self) -> None:
+    def test_search_and_format_with_project_hint(
+        self, make_search: Callable[..., SmartSearch]
+    ) -> None:
         """Test search_and_format includes project hint."""
         mock_results = [
             SearchResult(
@@ -420,11 +700,7 @@ class TestSmartSearchErrorHandling:
             ),
         ]
 
-        searcher = object.__new__(SmartSearch)
-        searcher.intent_analyzer = None
-        searcher.local_searcher = MagicMock()
-        searcher.local_searcher.search.return_value = mock_results
-        searcher.reranker = ResultReranker()
+        searcher = make_search(mock_results)
 
         output = searcher.search_and_format("auth project")
         assert "auth project" in output